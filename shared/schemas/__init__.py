@@ -23,7 +23,20 @@ from .users import (
     StudentProfile,
     TeacherProfile,
     AdminProfile,
-    UserRole
+    UserRole,
+    USER_ROLES,
+    LEARNING_STYLES,
+    UserCreateAdapter,
+    UserUpdateAdapter,
+    UserResponseAdapter,
+    UserLoginAdapter,
+    TokenResponseAdapter,
+    StudentProfileAdapter,
+    TeacherProfileAdapter,
+    AdminProfileAdapter,
+    UserPreferencesAdapter,
+    dump_user,
+    dump_token
 )
 
 from .content import (
@@ -58,6 +71,19 @@ __all__ = [
     "TeacherProfile",
     "AdminProfile",
     "UserRole",
+    "USER_ROLES",
+    "LEARNING_STYLES",
+    "UserCreateAdapter",
+    "UserUpdateAdapter",
+    "UserResponseAdapter",
+    "UserLoginAdapter",
+    "TokenResponseAdapter",
+    "StudentProfileAdapter",
+    "TeacherProfileAdapter",
+    "AdminProfileAdapter",
+    "UserPreferencesAdapter",
+    "dump_user",
+    "dump_token",
     
     # Content schemas
     "ContentBase",
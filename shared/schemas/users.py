@@ -6,12 +6,65 @@ It defines user base schemas, creation, update, and response models
 for the MathVerse platform.
 """
 
+import re
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, EmailStr, Field
+from types import MappingProxyType
+from typing import Annotated, Any, Dict, FrozenSet, List, Mapping, Optional
+from pydantic import BaseModel, BeforeValidator, ConfigDict, EmailStr, Field, TypeAdapter
+from pydantic.json_schema import WithJsonSchema
 from enum import Enum
 
 
+# E.164 phone number pattern, shared so every phone field reuses one validator
+_E164_PATTERN = r"^\+?[1-9]\d{1,14}$"
+
+PhoneStr = Annotated[str, Field(pattern=_E164_PATTERN)]
+
+# Shared constrained string types reused across user schemas
+NameStr = Annotated[str, Field(min_length=1, max_length=100)]
+BioStr = Annotated[str, Field(max_length=500)]
+PasswordStr = Annotated[str, Field(min_length=8, max_length=128)]
+LangStr = Annotated[str, Field(max_length=10)]
+TZStr = Annotated[str, Field(max_length=50)]
+
+# Config for read-mostly response schemas: immutable and strict about extras
+_READ_ONLY_CONFIG = ConfigDict(
+    from_attributes=True,
+    frozen=True,
+    extra="forbid"
+)
+
+# Cheap structural pre-check run before the full email-validator pass
+_EMAIL_FAST_RE = re.compile(r"^[^@\s]{1,64}@[^@\s]{1,255}$")
+_EMAIL_TA = TypeAdapter(EmailStr)
+
+
+def _validate_email(value: str) -> str:
+    """
+    Validate an email address, rejecting malformed input early.
+    
+    Args:
+        value: Raw email address
+        
+    Returns:
+        Normalized email address
+    """
+    if (
+        not isinstance(value, str)
+        or not 3 <= len(value) <= 254
+        or not _EMAIL_FAST_RE.match(value)
+    ):
+        raise ValueError("value is not a valid email address")
+    return _EMAIL_TA.validate_python(value)
+
+
+EmailAddress = Annotated[
+    str,
+    BeforeValidator(_validate_email),
+    WithJsonSchema({"type": "string", "format": "email"}),
+]
+
+
 class UserRole(str, Enum):
     """User role enumeration."""
     
@@ -31,23 +84,29 @@ class LearningStyle(str, Enum):
     MIXED = "mixed"
 
 
+# Raw enum values for cheap membership checks before full validation
+# (e.g., rejecting bad rows in bulk user imports)
+USER_ROLES: FrozenSet[str] = frozenset(role.value for role in UserRole)
+LEARNING_STYLES: FrozenSet[str] = frozenset(style.value for style in LearningStyle)
+
+
 class UserBase(BaseModel):
     """Base user schema with common fields."""
     
-    email: EmailStr = Field(..., description="User email address")
-    first_name: str = Field(..., min_length=1, max_length=100)
-    last_name: str = Field(..., min_length=1, max_length=100)
-    phone: Optional[str] = Field(default=None, pattern=r"^\+?[1-9]\d{1,14}$")
+    email: EmailAddress = Field(..., description="User email address")
+    first_name: NameStr
+    last_name: NameStr
+    phone: Optional[PhoneStr] = None
     avatar_url: Optional[str] = Field(default=None, description="URL to user avatar")
-    bio: Optional[str] = Field(default=None, max_length=500)
-    language: str = Field(default="en", max_length=10)
-    timezone: str = Field(default="UTC", max_length=50)
+    bio: Optional[BioStr] = None
+    language: LangStr = "en"
+    timezone: TZStr = "UTC"
 
 
 class UserCreate(UserBase):
     """Schema for creating a new user."""
     
-    password: str = Field(..., min_length=8, max_length=128)
+    password: PasswordStr
     role: UserRole = Field(default=UserRole.STUDENT)
     terms_accepted: bool = Field(..., description="Acceptance of terms of service")
     marketing_consent: bool = Field(default=False, description="Marketing email consent")
@@ -68,14 +127,14 @@ class UserCreate(UserBase):
 class UserUpdate(BaseModel):
     """Schema for updating user information."""
     
-    first_name: Optional[str] = Field(default=None, min_length=1, max_length=100)
-    last_name: Optional[str] = Field(default=None, min_length=1, max_length=100)
-    phone: Optional[str] = Field(default=None, pattern=r"^\+?[1-9]\d{1,14}$")
-    avatar_url: Optional[str] = default=None
-    bio: Optional[str] = Field(default=None, max_length=500)
-    language: Optional[str] = Field(default=None, max_length=10)
-    timezone: Optional[str] = Field(default=None, max_length=50)
-    preferences: Optional[Dict[str, Any]] = default=None
+    first_name: Optional[NameStr] = None
+    last_name: Optional[NameStr] = None
+    phone: Optional[PhoneStr] = None
+    avatar_url: Optional[str] = Field(default=None, description="URL to user avatar")
+    bio: Optional[BioStr] = None
+    language: Optional[LangStr] = None
+    timezone: Optional[TZStr] = None
+    preferences: Optional[Dict[str, Any]] = Field(default=None)
 
 
 class UserResponse(UserBase):
@@ -89,14 +148,13 @@ class UserResponse(UserBase):
     updated_at: Optional[datetime] = None
     last_login_at: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
+    model_config = _READ_ONLY_CONFIG
 
 
 class UserLogin(BaseModel):
     """Schema for user login request."""
     
-    email: EmailStr = Field(..., description="User email address")
+    email: EmailAddress = Field(..., description="User email address")
     password: str = Field(..., description="User password")
     remember_me: bool = Field(default=False, description="Extended session duration")
     
@@ -118,6 +176,8 @@ class TokenResponse(BaseModel):
     token_type: str = Field(default="bearer")
     expires_in: int = Field(..., description="Token expiration time in seconds")
     user: UserResponse = Field(..., description="User information")
+    
+    model_config = _READ_ONLY_CONFIG
 
 
 class RefreshTokenRequest(BaseModel):
@@ -129,7 +189,7 @@ class RefreshTokenRequest(BaseModel):
 class PasswordResetRequest(BaseModel):
     """Schema for password reset request."""
     
-    email: EmailStr = Field(..., description="User email address")
+    email: EmailAddress = Field(..., description="User email address")
     
     class Config:
         json_schema_extra = {
@@ -141,14 +201,14 @@ class PasswordResetConfirm(BaseModel):
     """Schema for password reset confirmation."""
     
     token: str = Field(..., description="Password reset token")
-    new_password: str = Field(..., min_length=8, max_length=128)
+    new_password: PasswordStr
 
 
 class PasswordChange(BaseModel):
     """Schema for password change."""
     
     current_password: str = Field(..., description="Current password")
-    new_password: str = Field(..., min_length=8, max_length=128)
+    new_password: PasswordStr
 
 
 class StudentProfile(BaseModel):
@@ -158,7 +218,7 @@ class StudentProfile(BaseModel):
     grade_level: Optional[int] = Field(default=None, ge=1, le=12)
     learning_style: LearningStyle = Field(default=LearningStyle.MIXED)
     preferred_difficulty: str = Field(default="intermediate")
-    daily_goal_minutes: int = Field(default=30, ge=5, ge=180)
+    daily_goal_minutes: int = Field(default=30, ge=5, le=180)
     weak_areas: List[str] = Field(default_factory=list)
     strong_areas: List[str] = Field(default_factory=list)
     completed_courses: List[str] = Field(default_factory=list)
@@ -168,8 +228,7 @@ class StudentProfile(BaseModel):
     streak_days: int = Field(default=0)
     last_activity_date: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
+    model_config = _READ_ONLY_CONFIG
 
 
 class TeacherProfile(BaseModel):
@@ -186,8 +245,7 @@ class TeacherProfile(BaseModel):
     average_rating: float = Field(default=0.0)
     total_reviews: int = Field(default=0)
     
-    class Config:
-        from_attributes = True
+    model_config = _READ_ONLY_CONFIG
 
 
 class AdminProfile(BaseModel):
@@ -199,8 +257,29 @@ class AdminProfile(BaseModel):
     superuser: bool = Field(default=False)
     audit_log_access: bool = Field(default=False)
     
-    class Config:
-        from_attributes = True
+    model_config = _READ_ONLY_CONFIG
+
+
+# Read-only default templates for UserPreferences; each instance gets a copy
+_NOTIFICATION_DEFAULTS: Mapping[str, bool] = MappingProxyType({
+    "email": True,
+    "push": True,
+    "sms": False,
+    "weekly_progress": True,
+    "marketing": False
+})
+
+_PRIVACY_DEFAULTS: Mapping[str, bool] = MappingProxyType({
+    "show_profile": True,
+    "show_progress": True,
+    "allow_analytics": True
+})
+
+_DISPLAY_DEFAULTS: Mapping[str, Any] = MappingProxyType({
+    "items_per_page": 20,
+    "auto_play_videos": True,
+    "show_subtitles": True
+})
 
 
 class UserPreferences(BaseModel):
@@ -209,21 +288,50 @@ class UserPreferences(BaseModel):
     user_id: str
     theme: str = Field(default="light")
     language: str = Field(default="en")
-    notifications: Dict[str, bool] = Field(default_factory=lambda: {
-        "email": True,
-        "push": True,
-        "sms": False,
-        "weekly_progress": True,
-        "marketing": False
-    })
-    privacy_settings: Dict[str, bool] = Field(default_factory=lambda: {
-        "show_profile": True,
-        "show_progress": True,
-        "allow_analytics": True
-    })
-    display_settings: Dict[str, Any] = Field(default_factory=lambda: {
-        "items_per_page": 20,
-        "auto_play_videos": True,
-        "show_subtitles": True
-    })
+    notifications: Dict[str, bool] = Field(default_factory=_NOTIFICATION_DEFAULTS.copy)
+    privacy_settings: Dict[str, bool] = Field(default_factory=_PRIVACY_DEFAULTS.copy)
+    display_settings: Dict[str, Any] = Field(default_factory=_DISPLAY_DEFAULTS.copy)
     updated_at: datetime = Field(default_factory=datetime.now)
+    
+    model_config = _READ_ONLY_CONFIG
+
+
+# Module-level adapters so hot paths reuse one compiled validator/serializer per type
+UserCreateAdapter = TypeAdapter(UserCreate)
+UserUpdateAdapter = TypeAdapter(UserUpdate)
+UserResponseAdapter = TypeAdapter(UserResponse)
+UserLoginAdapter = TypeAdapter(UserLogin)
+TokenResponseAdapter = TypeAdapter(TokenResponse)
+StudentProfileAdapter = TypeAdapter(StudentProfile)
+TeacherProfileAdapter = TypeAdapter(TeacherProfile)
+AdminProfileAdapter = TypeAdapter(AdminProfile)
+UserPreferencesAdapter = TypeAdapter(UserPreferences)
+
+
+def dump_user(user: UserResponse) -> bytes:
+    """
+    Serialize a user response straight to JSON bytes.
+    
+    Uses pydantic-core's native serializer, skipping the stdlib json
+    encoder, so the result can be returned as a raw response body.
+    
+    Args:
+        user: User response to serialize
+        
+    Returns:
+        UTF-8 encoded JSON
+    """
+    return UserResponse.__pydantic_serializer__.to_json(user)
+
+
+def dump_token(token: TokenResponse) -> bytes:
+    """
+    Serialize a token response (including its user) straight to JSON bytes.
+    
+    Args:
+        token: Token response to serialize
+        
+    Returns:
+        UTF-8 encoded JSON
+    """
+    return TokenResponse.__pydantic_serializer__.to_json(token)
@@ -0,0 +1,70 @@
+"""
+MathVerse Shared Utilities - Test Configuration
+===============================================
+Pytest configuration and fixtures for the shared utilities.
+"""
+
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+
+UTILS_DIR = Path(__file__).resolve().parent.parent / "utils"
+
+
+def load_utils_module(name: str) -> ModuleType:
+    """
+    Load a single shared utility module by file path.
+    
+    The package ``__init__`` imports every utility module (database,
+    security, ...) and their service dependencies, so tests load the
+    module under test on its own.
+    """
+    spec = importlib.util.spec_from_file_location(
+        f"shared_utils_{name}", UTILS_DIR / f"{name}.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def validation() -> ModuleType:
+    """
+    The shared validation module.
+    """
+    return load_utils_module("validation")
+
+
+@pytest.fixture(scope="session")
+def helpers() -> ModuleType:
+    """
+    The shared helpers module.
+    """
+    return load_utils_module("helpers")
+
+
+@pytest.fixture(scope="session")
+def logger() -> ModuleType:
+    """
+    The shared logger module.
+    """
+    return load_utils_module("logger")
+
+
+@pytest.fixture(scope="session")
+def security() -> ModuleType:
+    """
+    The shared security module.
+    """
+    return load_utils_module("security")
+
+
+@pytest.fixture(scope="session")
+def formatters() -> ModuleType:
+    """
+    The shared formatters module.
+    """
+    return load_utils_module("formatters")
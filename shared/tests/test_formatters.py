@@ -0,0 +1,81 @@
+"""
+MathVerse Shared Utilities - Formatter Tests
+============================================
+Tests for display formatting helpers.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+
+@pytest.fixture(params=["numpy", "python"])
+def batch_formatters(request, formatters, monkeypatch):
+    """
+    The formatters module with its NumPy fast path on or off.
+    """
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+        assert formatters.np is not None
+    else:
+        monkeypatch.setattr(formatters, "np", None)
+    return formatters
+
+
+def test_format_grade_levels_matches_scalar(batch_formatters):
+    """
+    Test that batch grade formatting agrees with format_grade_level.
+    """
+    levels = list(range(1, 25))
+    
+    expected = [batch_formatters.format_grade_level(level) for level in levels]
+    
+    assert batch_formatters.format_grade_levels(levels) == expected
+
+
+def test_format_grade_levels_accepts_generator(batch_formatters):
+    """
+    Test that any iterable of levels is accepted.
+    """
+    levels = (level for level in (1, 2, 3, 11, 22))
+    
+    assert batch_formatters.format_grade_levels(levels) == [
+        "1st grade", "2nd grade", "3rd grade", "11th grade", "22nd grade"
+    ]
+
+
+def _past_dates():
+    now = datetime.now().replace(microsecond=0)
+    offsets = [
+        timedelta(seconds=10),
+        timedelta(minutes=5, seconds=30),
+        timedelta(hours=3, minutes=10),
+        timedelta(days=2, hours=1),
+        timedelta(days=15),
+        timedelta(days=45),
+        timedelta(days=800),
+    ]
+    return [now - offset for offset in offsets]
+
+
+def test_format_relative_times_matches_scalar(batch_formatters):
+    """
+    Test that batch relative times agree with format_relative_time.
+    """
+    dates = _past_dates()
+    
+    expected = [batch_formatters.format_relative_time(date) for date in dates]
+    
+    assert batch_formatters.format_relative_times(iter(dates)) == expected
+
+
+def test_format_relative_times_rejects_aware_datetimes(batch_formatters):
+    """
+    Test that aware datetimes are rejected like in format_relative_time.
+    """
+    aware = datetime.now(timezone.utc)
+    
+    with pytest.raises(TypeError):
+        batch_formatters.format_relative_time(aware)
+    with pytest.raises(TypeError):
+        batch_formatters.format_relative_times(date for date in [aware])
@@ -0,0 +1,33 @@
+"""
+MathVerse Shared Utilities - Helper Tests
+=========================================
+Tests for general-purpose helper functions.
+"""
+
+import pytest
+
+
+def test_group_by_key_func_accepts_generator(helpers):
+    """
+    Test that grouping a generator pairs every item with its own key.
+    """
+    groups = helpers.group_by((x for x in [1, 2, 3, 4, 5]), lambda x: x % 2)
+    
+    assert groups == {1: [1, 3, 5], 0: [2, 4]}
+
+
+def test_group_by_precomputed_keys(helpers):
+    """
+    Test grouping with precomputed keys.
+    """
+    groups = helpers.group_by(["a", "b", "c"], keys=[1, 2, 1])
+    
+    assert groups == {1: ["a", "c"], 2: ["b"]}
+
+
+def test_group_by_rejects_mismatched_keys(helpers):
+    """
+    Test that keys and items of different lengths are rejected.
+    """
+    with pytest.raises(ValueError):
+        helpers.group_by(["a", "b", "c"], keys=[1, 2])
@@ -0,0 +1,39 @@
+"""
+MathVerse Shared Utilities - Logger Tests
+=========================================
+Tests for the structured logging configuration.
+"""
+
+import json
+
+import pytest
+
+structlog = pytest.importorskip("structlog")
+pytest.importorskip("orjson")
+
+
+@pytest.fixture(scope="module")
+def renderer(logger):
+    """
+    JSONRenderer wired to the orjson serializer.
+    """
+    return structlog.processors.JSONRenderer(serializer=logger._orjson_serializer)
+
+
+@pytest.mark.parametrize(
+    "event",
+    [
+        {"event": "counts", "by_grade": {1: 5}},
+        {"event": "big", "v": 2**70},
+        {"event": "plain", "user": "u1", "ok": True},
+    ],
+)
+def test_orjson_renderer_matches_stdlib(renderer, event):
+    """
+    Test that events orjson can't encode natively still render.
+    """
+    stdlib = structlog.processors.JSONRenderer()
+    
+    rendered = renderer(None, "info", dict(event))
+    
+    assert json.loads(rendered) == json.loads(stdlib(None, "info", dict(event)))
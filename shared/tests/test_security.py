@@ -0,0 +1,222 @@
+"""
+MathVerse Shared Utilities - Security Tests
+===========================================
+Tests for JWT handling and related security helpers.
+"""
+
+import base64
+import calendar
+import hashlib
+import hmac
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("jose")
+pytest.importorskip("passlib")
+pytest.importorskip("cryptography")
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from jose import JWTError, jwt
+from passlib.hash import bcrypt as passlib_bcrypt
+
+
+def _claims(security, **overrides):
+    now = int(time.time())
+    claims = {
+        "sub": "user-1",
+        "type": security.TokenType.ACCESS.value,
+        "exp": now + 60,
+        "iat": now,
+    }
+    claims.update(overrides)
+    return claims
+
+
+def _tamper(segment: str) -> str:
+    raw = bytearray(base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4)))
+    raw[0] ^= 0x01
+    return base64.urlsafe_b64encode(bytes(raw)).rstrip(b"=").decode()
+
+
+def test_encode_jwt_int_exp_decodes_with_jose(security):
+    """
+    Test that hand-built HS256 tokens decode with python-jose.
+    """
+    claims = _claims(security)
+    
+    token = security._encode_jwt(claims)
+    decoded = jwt.decode(token, security.JWT_SECRET_KEY, algorithms=["HS256"])
+    
+    assert decoded == claims
+    assert jwt.get_unverified_header(token) == {"alg": "HS256", "typ": "JWT"}
+
+
+def test_encode_jwt_datetime_exp_decodes_with_jose(security):
+    """
+    Test that datetime time claims are encoded as NumericDate ints.
+    """
+    now = datetime.utcnow().replace(microsecond=0)
+    claims = _claims(security, exp=now + timedelta(minutes=5), iat=now, nbf=now)
+    
+    token = security._encode_jwt(claims)
+    decoded = jwt.decode(token, security.JWT_SECRET_KEY, algorithms=["HS256"])
+    
+    assert decoded["exp"] == calendar.timegm((now + timedelta(minutes=5)).utctimetuple())
+    assert decoded["iat"] == decoded["nbf"] == calendar.timegm(now.utctimetuple())
+    assert isinstance(claims["exp"], datetime)  # caller's payload is untouched
+    assert security.verify_token(token) is not None
+
+
+def test_encode_jwt_matches_jose(security):
+    """
+    Test that the inline signer produces the same signature as jose.
+    """
+    claims = _claims(security)
+    
+    token = security._encode_jwt(claims)
+    expected = jwt.encode(claims, security.JWT_SECRET_KEY, algorithm="HS256")
+    
+    assert jwt.decode(token, security.JWT_SECRET_KEY, algorithms=["HS256"]) == (
+        jwt.decode(expected, security.JWT_SECRET_KEY, algorithms=["HS256"])
+    )
+
+
+@pytest.mark.parametrize("part", [1, 2])
+def test_tampered_tokens_are_rejected(security, part: int):
+    """
+    Test that changing the payload or signature invalidates the token.
+    """
+    segments = security.create_access_token("user-1").split(".")
+    segments[part] = _tamper(segments[part])
+    token = ".".join(segments)
+    
+    with pytest.raises(JWTError):
+        jwt.decode(token, security.JWT_SECRET_KEY, algorithms=["HS256"])
+    assert security.verify_token(token) is None
+
+
+def test_encode_jwt_uses_current_secret(security, monkeypatch):
+    """
+    Test that tokens are signed with the current JWT_SECRET_KEY.
+    """
+    monkeypatch.setattr(security, "JWT_SECRET_KEY", "patched-secret")
+    
+    token = security.create_access_token("user-1")
+    
+    assert jwt.decode(token, "patched-secret", algorithms=["HS256"])["sub"] == "user-1"
+    assert security.verify_token(token)["sub"] == "user-1"
+
+
+def test_verify_cache_honours_token_expiry(security, monkeypatch):
+    """
+    Test that a cached payload is not served past the token's exp claim.
+    """
+    monkeypatch.setattr(security, "_VERIFY_CACHE_TTL", 3600.0)
+    exp = int(time.time()) + 1
+    token = security._encode_jwt(_claims(security, exp=exp))
+    
+    assert security.verify_token(token) is not None
+    
+    # jose compares exp against whole seconds, so wait for the next second
+    while int(time.time()) <= exp:
+        time.sleep(0.05)
+    
+    assert security.verify_token(token) is None
+
+
+def test_invalidate_token_forces_reverification(security, monkeypatch):
+    """
+    Test that invalidate_token drops the cached verification result.
+    """
+    token = security.create_access_token("user-1")
+    assert security.verify_token(token) is not None
+    
+    # A cache hit skips the signature check, so the rotated key is not seen yet
+    monkeypatch.setattr(security, "JWT_SECRET_KEY", "rotated-secret")
+    assert security.verify_token(token) is not None
+    
+    security.invalidate_token(token)
+    
+    assert security.verify_token(token) is None
+
+
+def test_verify_token_returns_independent_copies(security):
+    """
+    Test that mutating a returned payload does not change the cached one.
+    """
+    token = security.create_access_token("user-1", role="student", permissions=["read"])
+    
+    first = security.verify_token(token)
+    first["role"] = "admin"
+    first["permissions"].append("admin")
+    second = security.verify_token(token)
+    
+    assert second["role"] == "student"
+    assert second["permissions"] == ["read"]
+
+
+def test_encrypt_data_round_trip(security):
+    """
+    Test that data encrypted with a key decrypts with the same key.
+    """
+    key = AESGCM.generate_key(bit_length=256)
+    
+    encrypted = security.encrypt_data("secret", key, associated_data=b"user-1")
+    
+    assert security.decrypt_data(encrypted, key, associated_data=b"user-1") == "secret"
+    with pytest.raises(InvalidTag):
+        security.decrypt_data(encrypted, AESGCM.generate_key(bit_length=256), b"user-1")
+
+
+def test_encrypt_data_requires_key(security):
+    """
+    Test that encrypting without a key fails instead of discarding one.
+    """
+    with pytest.raises(TypeError):
+        security.encrypt_data("secret")
+
+
+def test_password_hashes_use_argon2id_and_upgrade_bcrypt(security):
+    """
+    Test that new hashes are argon2id and legacy bcrypt hashes still verify.
+    """
+    bcrypt_hash = passlib_bcrypt.using(rounds=4).hash("hunter22")
+    
+    new_hash = security.hash_password("hunter22")
+    
+    assert new_hash.startswith("$argon2id$")
+    assert security.verify_password("hunter22", new_hash)
+    assert not security.password_needs_rehash(new_hash)
+    assert security.verify_password("hunter22", bcrypt_hash)
+    assert security.password_needs_rehash(bcrypt_hash)
+
+
+def test_hash_hmac_does_not_retain_caller_secrets(security):
+    """
+    Test that caller-supplied secrets are signed without being cached.
+    """
+    module_keys = dict(security._MODULE_HMACS)
+    
+    signature = security.hash_hmac("payload", "caller-secret")
+    
+    assert signature == hmac.new(b"caller-secret", b"payload", hashlib.sha256).hexdigest()
+    assert security.verify_hmac("payload", signature, "caller-secret")
+    assert security._MODULE_HMACS == module_keys
+
+
+def test_hash_api_key_secret_uses_current_pepper(security, monkeypatch):
+    """
+    Test that API key hashes follow the configured pepper.
+    """
+    monkeypatch.setattr(security, "API_KEY_PEPPER", "pepper-1")
+    hashed = security.hash_api_key_secret("secret")
+    
+    assert hashed == hmac.new(b"pepper-1", b"secret", hashlib.sha256).hexdigest()
+    assert security.verify_api_key_secret("secret", hashed)
+    
+    monkeypatch.setattr(security, "API_KEY_PEPPER", None)
+    with pytest.raises(RuntimeError):
+        security.hash_api_key_secret("secret")
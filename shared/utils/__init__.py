@@ -17,8 +17,10 @@ from .logger import (
 from .security import (
     create_access_token,
     verify_token,
+    invalidate_token,
     hash_password,
     verify_password,
+    verify_password_async,
     generate_secret_key,
     encrypt_data,
     decrypt_data,
@@ -73,8 +75,10 @@ __all__ = [
     # Security utilities
     "create_access_token",
     "verify_token",
+    "invalidate_token",
     "hash_password",
     "verify_password",
+    "verify_password_async",
     "generate_secret_key",
     "encrypt_data",
     "decrypt_data",
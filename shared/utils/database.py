@@ -7,13 +7,14 @@ and asynchronous database support.
 """
 
 import os
-from contextlib import contextmanager
-from typing import Generator, Optional, Type
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncGenerator, Callable, Generator, Iterable, Optional, Type
 
-from sqlalchemy import create_engine, event
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker, Session, declarative_base, SessionLocal
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.pool import QueuePool
+from sqlalchemy.pool import NullPool, QueuePool
 
 
 # Database URL from environment
@@ -28,6 +29,58 @@ ASYNC_DATABASE_URL = os.getenv(
 )
 
 
+# Connection pool configuration
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "3600"))
+DB_POOL_CLASS = os.getenv("DB_POOL_CLASS", "queue").lower()
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "false").lower() in ("1", "true", "yes")
+
+_POOL_CLASSES = {
+    "queue": QueuePool,
+    "null": NullPool
+}
+
+
+def _pool_options(is_async: bool = False) -> dict:
+    """
+    Build engine pool keyword arguments from the environment.
+    
+    ``DB_POOL_CLASS=null`` disables pooling (one connection per checkout),
+    which suits short-lived serverless processes. Sizing options are only
+    passed for queue pools, since NullPool does not accept them.
+    
+    Args:
+        is_async: Whether the options are for an async engine
+        
+    Returns:
+        Keyword arguments for create_engine/create_async_engine
+    """
+    if DB_POOL_CLASS not in _POOL_CLASSES:
+        raise ValueError(
+            f"Unsupported DB_POOL_CLASS '{DB_POOL_CLASS}'. "
+            f"Expected one of: {', '.join(_POOL_CLASSES)}"
+        )
+    
+    options = {"pool_pre_ping": DB_POOL_PRE_PING}
+    
+    if DB_POOL_CLASS == "null":
+        options["poolclass"] = NullPool
+        return options
+    
+    # Async engines pick their own async-adapted queue pool
+    if not is_async:
+        options["poolclass"] = QueuePool
+    
+    options.update(
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_recycle=DB_POOL_RECYCLE
+    )
+    
+    return options
+
+
 # Create base class for models
 Base = declarative_base()
 
@@ -69,12 +122,8 @@ def get_engine():
     if _engine is None:
         _engine = create_engine(
             DATABASE_URL,
-            poolclass=QueuePool,
-            pool_size=5,
-            max_overflow=10,
-            pool_pre_ping=True,
-            pool_recycle=3600,
-            echo=False
+            echo=False,
+            **_pool_options()
         )
     
     return _engine
@@ -159,9 +208,7 @@ def get_async_engine():
         _async_engine = create_async_engine(
             ASYNC_DATABASE_URL,
             echo=False,
-            pool_pre_ping=True,
-            pool_size=5,
-            max_overflow=10
+            **_pool_options(is_async=True)
         )
     
     return _async_engine
@@ -189,11 +236,11 @@ def get_async_session_factory() -> async_sessionmaker:
     return _async_session_factory
 
 
-async def get_async_session() -> AsyncSession:
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency for getting an async database session.
     
-    Returns:
+    Yields:
         AsyncSession instance
     """
     SessionFactory = get_async_session_factory()
@@ -201,14 +248,14 @@ async def get_async_session() -> AsyncSession:
         yield session
 
 
-@contextmanager
-async def async_session_scope() -> Generator[AsyncSession, None, None]:
+@asynccontextmanager
+async def async_session_scope() -> AsyncGenerator[AsyncSession, None]:
     """
     Context manager for async database session.
     
     Usage:
         async with async_session_scope() as session:
-            await session.add(new_object)
+            session.add(new_object)
     
     Yields:
         AsyncSession
@@ -277,6 +324,10 @@ def run_migrations(target: str, revision: str = "head") -> None:
     command.upgrade(alembic_cfg, revision)
 
 
+# Pre-built liveness probe shared by the health checks
+_HEALTH_QUERY = text("SELECT 1")
+
+
 class DatabaseHealthCheck:
     """
     Utility for checking database connectivity.
@@ -293,7 +344,7 @@ class DatabaseHealthCheck:
         try:
             engine = get_engine()
             with engine.connect() as conn:
-                conn.execute("SELECT 1")
+                conn.execute(_HEALTH_QUERY).scalar()
             return True
         except Exception:
             return False
@@ -309,7 +360,7 @@ class DatabaseHealthCheck:
         try:
             engine = get_async_engine()
             async with engine.connect() as conn:
-                await conn.execute("SELECT 1")
+                (await conn.execute(_HEALTH_QUERY)).scalar()
             return True
         except Exception:
             return False
@@ -318,12 +369,15 @@ class DatabaseHealthCheck:
 class TransactionManager:
     """
     Manager for complex database transactions.
+    
+    Queued operations are consumed as they run, so a manager can be
+    refilled and executed again without replaying earlier work.
     """
     
     def __init__(self, session: Session):
         """Initialize with a database session."""
         self.session = session
-        self.operations = []
+        self.operations = deque()
     
     def add_operation(self, func, *args, **kwargs):
         """
@@ -336,46 +390,71 @@ class TransactionManager:
         """
         self.operations.append((func, args, kwargs))
     
+    def run(self, ops: Iterable[Callable[[Session], Any]]) -> list:
+        """
+        Run operations immediately inside a single transaction.
+        
+        Each operation receives the session. Nothing is queued, and the
+        transaction commits (or releases its savepoint, if the session was
+        already in a transaction) once all operations succeed.
+        
+        Args:
+            ops: Callables taking the session
+            
+        Returns:
+            List of operation results
+        """
+        if self.session.in_transaction():
+            transaction = self.session.begin_nested()
+        else:
+            transaction = self.session.begin()
+        
+        with transaction:
+            return [op(self.session) for op in ops]
+    
     def execute(self) -> list:
         """
-        Execute all operations in a single transaction.
+        Execute all queued operations in a single transaction.
         
         Returns:
             List of operation results
         """
         results = []
+        operations = self.operations
         
         try:
-            for func, args, kwargs in self.operations:
-                result = func(*args, **kwargs)
-                results.append(result)
+            while operations:
+                func, args, kwargs = operations.popleft()
+                results.append(func(*args, **kwargs))
             
             self.session.flush()
             return results
             
         except Exception:
+            operations.clear()
             self.session.rollback()
             raise
     
     def execute_nested(self) -> list:
         """
-        Execute operations with savepoints for partial rollback.
+        Execute queued operations with savepoints for partial rollback.
         
         Returns:
             List of operation results
         """
         results = []
+        operations = self.operations
         
-        for i, (func, args, kwargs) in enumerate(self.operations):
-            savepoint_name = f"sp_{i}"
+        while operations:
+            func, args, kwargs = operations.popleft()
             
             try:
-                self.session.execute(f"SAVEPOINT {savepoint_name}")
-                result = func(*args, **kwargs)
+                # begin_nested() emits SAVEPOINT and rolls back to it on error
+                with self.session.begin_nested():
+                    result = func(*args, **kwargs)
                 results.append(result)
                 
             except Exception:
-                self.session.execute(f"ROLLBACK TO SAVEPOINT {savepoint_name}")
                 results.append(None)
         
         return results
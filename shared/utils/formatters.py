@@ -6,10 +6,132 @@ platform, including date/time formatting, number formatting, and
 display formatting.
 """
 
+import locale as locale_module
+import re
+import threading
 from datetime import datetime, timedelta
-from typing import Optional, Union
+from functools import lru_cache
+from typing import Callable, Iterable, List, Optional, Union
 from decimal import Decimal
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+try:
+    from ciso8601 import parse_datetime as _ciso_parse
+except ImportError:  # pragma: no cover - ciso8601 is optional
+    _ciso_parse = None
+
+
+# Date/time format presets
+_DATE_FORMATS = {
+    "short": "%m/%d/%y",
+    "medium": "%b %d, %Y",
+    "long": "%B %d, %Y",
+    "full": "%A, %B %d, %Y"
+}
+
+_DATETIME_FORMATS = {
+    "short": "%m/%d/%y %H:%M",
+    "medium": "%b %d, %Y %I:%M %p",
+    "long": "%B %d, %Y at %I:%M %p"
+}
+
+# (threshold_seconds, unit) pairs for relative times, largest first
+_REL_UNITS = (
+    (31536000, "year"),
+    (2592000, "month"),
+    (604800, "week"),
+    (86400, "day"),
+    (3600, "hour"),
+    (60, "minute")
+)
+
+# Ascending thresholds for the vectorized relative-time path
+_REL_THRESHOLDS = (
+    np.array([threshold for threshold, _ in reversed(_REL_UNITS)], dtype=np.int64)
+    if np is not None else None
+)
+
+# (threshold_bytes, divisor, suffix) triples for file sizes, largest first
+_SIZE_UNITS = (
+    (1 << 30, 1 << 30, "GB"),
+    (1 << 20, 1 << 20, "MB"),
+    (1 << 10, 1 << 10, "KB")
+)
+
+# Ordinal suffix indexed by the last digit of a grade level
+_GRADE_SUFFIXES = ("th", "st", "nd", "rd", "th", "th", "th", "th", "th", "th")
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """
+    Parse an ISO 8601 string, accepting a trailing "Z" for UTC.
+    
+    Uses the C ``ciso8601`` parser when installed, which understands
+    "Z" natively, and ``datetime.fromisoformat`` otherwise.
+    
+    Args:
+        value: ISO date/datetime string
+        
+    Returns:
+        Parsed datetime
+    """
+    if _ciso_parse is not None:
+        return _ciso_parse(value)
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+@lru_cache(maxsize=64)
+def _make_number_formatter(
+    decimal_places: int,
+    use_thousands_separator: bool
+) -> Callable[[float], str]:
+    """
+    Build a formatter for one decimal places/separator combination.
+    
+    Args:
+        decimal_places: Number of decimal places
+        use_thousands_separator: Whether to use commas
+        
+    Returns:
+        Bound str.format method for the combination
+    """
+    separator = "," if use_thousands_separator else ""
+    return f"{{:{separator}.{decimal_places}f}}".format
+
+
+# Locale most recently requested through format_currency; setlocale is
+# process-global, so it is only called again when this changes.
+_active_locale: Optional[str] = None
+_locale_lock = threading.Lock()
+
+
+def _ensure_locale(name: str) -> None:
+    """
+    Switch the process locale to ``name`` unless it is already active.
+    
+    Callers must hold ``_locale_lock``. Unknown locales leave the current
+    locale in place, matching the previous fallback behaviour.
+    
+    Args:
+        name: Locale name (e.g., "en_US")
+    """
+    global _active_locale
+    
+    if name == _active_locale:
+        return
+    
+    try:
+        locale_module.setlocale(locale_module.LC_ALL, name)
+    except locale_module.Error:
+        pass
+    
+    _active_locale = name
+
 
 def format_duration(
     seconds: int,
@@ -36,7 +158,7 @@ def format_duration(
     if minutes < 60:
         if format_type == "verbose":
             s = "" if minutes == 1 else "s"
-            return f"{minute}{s} {remaining_seconds} second{'s' if remaining_seconds != 1 else ''}"
+            return f"{minutes} minute{s}, {remaining_seconds} second{'s' if remaining_seconds != 1 else ''}"
         return f"{minutes}m {remaining_seconds}s"
     
     hours = minutes // 60
@@ -88,17 +210,15 @@ def format_number(
     Returns:
         Formatted number string
     """
-    if isinstance(number, float):
-        formatted = f"{number:,.{decimal_places}f}"
-    elif isinstance(number, Decimal):
-        formatted = f"{float(number):,.{decimal_places}f}"
-    else:
-        formatted = f"{number:,}"
+    if isinstance(number, int):
+        formatted = format(number, ",d" if use_thousands_separator else "d")
         
         if decimal_places > 0:
             formatted += "." + "0" * decimal_places
+        
+        return formatted
     
-    return formatted
+    return _make_number_formatter(decimal_places, use_thousands_separator)(float(number))
 
 
 def format_percentage(
@@ -139,16 +259,9 @@ def format_date(
         Formatted date string
     """
     if isinstance(date, str):
-        date = datetime.fromisoformat(date.replace("Z", "+00:00"))
-    
-    format_map = {
-        "short": "%m/%d/%y",
-        "medium": "%b %d, %Y",
-        "long": "%B %d, %Y",
-        "full": "%A, %B %d, %Y"
-    }
+        date = _parse_iso(date)
     
-    fmt = format_map.get(format_str, format_str)
+    fmt = _DATE_FORMATS.get(format_str, format_str)
     return date.strftime(fmt)
 
 
@@ -167,15 +280,9 @@ def format_datetime(
         Formatted datetime string
     """
     if isinstance(date, str):
-        date = datetime.fromisoformat(date.replace("Z", "+00:00"))
-    
-    format_map = {
-        "short": "%m/%d/%y %H:%M",
-        "medium": "%b %d, %Y %I:%M %p",
-        "long": "%B %d, %Y at %I:%M %p"
-    }
+        date = _parse_iso(date)
     
-    fmt = format_map.get(format_str, format_str)
+    fmt = _DATETIME_FORMATS.get(format_str, format_str)
     return date.strftime(fmt)
 
 
@@ -190,44 +297,65 @@ def format_relative_time(date: Union[datetime, str]) -> str:
         Relative time string
     """
     if isinstance(date, str):
-        date = datetime.fromisoformat(date.replace("Z", "+00:00"))
+        date = _parse_iso(date)
     
     now = datetime.now()
     diff = now - date
     
     seconds = diff.total_seconds()
     
-    if seconds < 60:
-        return "just now"
+    for threshold, unit in _REL_UNITS:
+        if seconds >= threshold:
+            n = int(seconds // threshold)
+            return f"{n} {unit}{'s' if n != 1 else ''} ago"
     
-    minutes = seconds / 60
-    if minutes < 60:
-        mins = int(minutes)
-        return f"{mins} minute{'s' if mins != 1 else ''} ago"
-    
-    hours = minutes / 60
-    if hours < 24:
-        hrs = int(hours)
-        return f"{hrs} hour{'s' if hrs != 1 else ''} ago"
-    
-    days = hours / 24
-    if days < 7:
-        d = int(days)
-        return f"{d} day{'s' if d != 1 else ''} ago"
-    
-    weeks = days / 7
-    if weeks < 4:
-        w = int(weeks)
-        return f"{w} week{'s' if w != 1 else ''} ago"
+    return "just now"
+
+
+def format_relative_times(dates: Iterable[datetime]) -> List[str]:
+    """
+    Format many dates as relative times (e.g., "2 hours ago") in one pass.
     
-    months = days / 30
-    if months < 12:
-        m = int(months)
-        return f"{m} month{'s' if m != 1 else ''} ago"
+    Bucket selection is vectorized with NumPy when it is available;
+    otherwise this falls back to calling format_relative_time per item.
     
-    years = days / 365
-    y = int(years)
-    return f"{y} year{'s' if y != 1 else ''} ago"
+    Args:
+        dates: Naive local datetimes or a datetime64 array
+        
+    Returns:
+        List of relative time strings
+        
+    Raises:
+        TypeError: If any datetime is timezone-aware
+    """
+    if np is None:
+        return [format_relative_time(date) for date in dates]
+    
+    if not isinstance(dates, np.ndarray):
+        dates = list(dates)
+        # NumPy would silently drop the offset; reject aware datetimes as
+        # format_relative_time does when subtracting them from now()
+        if any(getattr(date, "tzinfo", None) is not None for date in dates):
+            raise TypeError("can't subtract offset-naive and offset-aware datetimes")
+    
+    arr = np.asarray(dates, dtype="datetime64[s]")
+    now = np.datetime64(datetime.now(), "s")
+    seconds = (now - arr).astype(np.int64)
+    
+    # Index 0 is "just now"; index i > 0 selects _REL_UNITS[-i]
+    buckets = np.searchsorted(_REL_THRESHOLDS, seconds, side="right")
+    divisors = _REL_THRESHOLDS[np.maximum(buckets - 1, 0)]
+    counts = seconds // divisors
+    
+    results = []
+    for bucket, n in zip(buckets.tolist(), counts.tolist()):
+        if bucket == 0:
+            results.append("just now")
+        else:
+            unit = _REL_UNITS[-bucket][1]
+            results.append(f"{n} {unit}{'s' if n != 1 else ''} ago")
+    
+    return results
 
 
 def format_file_size(size_bytes: int) -> str:
@@ -240,19 +368,11 @@ def format_file_size(size_bytes: int) -> str:
     Returns:
         Formatted size string (e.g., "2.5 MB")
     """
-    if size_bytes < 1024:
-        return f"{size_bytes} B"
-    
-    size_kb = size_bytes / 1024
-    if size_kb < 1024:
-        return f"{size_kb:.1f} KB"
+    for threshold, divisor, suffix in _SIZE_UNITS:
+        if size_bytes >= threshold:
+            return f"{size_bytes / divisor:.1f} {suffix}"
     
-    size_mb = size_kb / 1024
-    if size_mb < 1024:
-        return f"{size_mb:.1f} MB"
-    
-    size_gb = size_mb / 1024
-    return f"{size_gb:.1f} GB"
+    return f"{size_bytes} B"
 
 
 def format_count(
@@ -349,12 +469,39 @@ def format_grade_level(level: int) -> str:
     Returns:
         Formatted grade string
     """
-    suffixes = {1: "st", 2: "nd", 3: "rd"}
-    suffix = suffixes.get(level % 10, "th") if level not in (11, 12, 13) else "th"
+    suffix = _GRADE_SUFFIXES[level % 10] if level not in (11, 12, 13) else "th"
     
     return f"{level}{suffix} grade"
 
 
+def format_grade_levels(levels: Iterable[int]) -> List[str]:
+    """
+    Format many grade levels for display in one pass.
+    
+    Suffix selection is vectorized with NumPy when it is available;
+    otherwise this falls back to calling format_grade_level per item.
+    
+    Args:
+        levels: Grade levels (1-12)
+        
+    Returns:
+        List of formatted grade strings
+    """
+    if np is None:
+        return [format_grade_level(level) for level in levels]
+    
+    # fromiter accepts generators as well as sequences and arrays
+    arr = np.fromiter(levels, dtype=np.int64)
+    idx = arr % 10
+    idx[np.isin(arr, (11, 12, 13))] = 0
+    suffixes = np.asarray(_GRADE_SUFFIXES)[idx]
+    
+    return [
+        f"{level}{suffix} grade"
+        for level, suffix in zip(arr.tolist(), suffixes.tolist())
+    ]
+
+
 def format_currency(
     amount: float,
     currency: str = "USD",
@@ -371,14 +518,10 @@ def format_currency(
     Returns:
         Formatted currency string
     """
-    import locale as locale_module
-    
-    try:
-        locale_module.setlocale(locale_module.LC_ALL, locale)
-    except locale_module.Error:
-        locale = "en_US.UTF-8"
-    
-    try:
-        return locale_module.currency(amount, currency, symbol=True, grouping=True)
-    except Exception:
-        return f"{currency} {amount:,.2f}"
+    with _locale_lock:
+        _ensure_locale(locale)
+        
+        try:
+            return locale_module.currency(amount, currency, symbol=True, grouping=True)
+        except Exception:
+            return f"{currency} {amount:,.2f}"
@@ -7,15 +7,27 @@ platform, including ID generation, retry logic, and data manipulation.
 
 import secrets
 import hashlib
+import importlib
+import inspect
 import time
 import random
+import re
 import string
+import threading
+from collections import defaultdict, deque
+from collections.abc import Mapping, Sequence
 from datetime import datetime
-from functools import wraps
-from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar, Union
+from functools import lru_cache, wraps
+from itertools import islice
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, TypeVar, Union
 import json
 import logging
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +35,48 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
+# camelCase word boundaries used by to_snake_case
+_CAMEL_WORD_RE = re.compile(r"(.)([A-Z][a-z]+)")
+_CAMEL_BOUNDARY_RE = re.compile(r"([a-z0-9])([A-Z])")
+
+# Each underscore and the segment after it, used by to_camel_case
+_SNAKE_SEGMENT_RE = re.compile(r"_([^_]*)")
+
+_ID_ALPHABET = string.ascii_letters + string.digits
+_SHORT_CODE_ALPHABET = string.ascii_uppercase + string.digits
+
+# Sentinel for lookups where None is a legitimate value
+_MISSING = object()
+
+
+def _random_string(alphabet: str, length: int) -> str:
+    """
+    Build a random string from one bulk draw of secure random bytes.
+    
+    Bytes at or above the largest multiple of ``len(alphabet)`` are
+    rejected so every character is equally likely.
+    
+    Args:
+        alphabet: Characters to choose from (at most 256)
+        length: Length of the string
+        
+    Returns:
+        Random string
+    """
+    size = len(alphabet)
+    limit = 256 - 256 % size
+    chars = []
+    
+    while len(chars) < length:
+        chars.extend(
+            alphabet[b % size]
+            for b in secrets.token_bytes(length - len(chars))
+            if b < limit
+        )
+    
+    return "".join(chars)
+
+
 def generate_unique_id(
     prefix: str = "",
     length: int = 16,
@@ -42,8 +96,7 @@ def generate_unique_id(
     if use_hex:
         random_part = secrets.token_hex(length // 2)
     else:
-        chars = string.ascii_letters + string.digits
-        random_part = "".join(secrets.choice(chars) for _ in range(length))
+        random_part = _random_string(_ID_ALPHABET, length)
     
     if prefix:
         return f"{prefix}_{random_part}"
@@ -60,8 +113,7 @@ def generate_short_code(length: int = 8) -> str:
     Returns:
         Short code string
     """
-    chars = string.ascii_uppercase + string.digits
-    return "".join(random.choice(chars) for _ in range(length))
+    return _random_string(_SHORT_CODE_ALPHABET, length)
 
 
 def retry_operation(
@@ -69,17 +121,28 @@ def retry_operation(
     max_retries: int = 3,
     delay: float = 1.0,
     backoff: float = 2.0,
-    exceptions: tuple = (Exception,)
+    exceptions: tuple = (Exception,),
+    jitter: float = 0.5,
+    max_delay: float = 30.0,
+    timeout: Optional[float] = None
 ) -> Callable:
     """
     Decorator for retrying a function on failure.
     
+    Delays grow exponentially up to ``max_delay`` and are stretched by a
+    random factor of up to ``jitter`` so that many clients failing at once
+    do not retry in lockstep.
+    
     Args:
         func: Function to wrap
         max_retries: Maximum retry attempts
         delay: Initial delay between retries
         backoff: Delay multiplier
         exceptions: Exceptions to catch
+        jitter: Maximum random fraction added to each delay
+        max_delay: Upper bound for the base delay between retries
+        timeout: Optional total time budget in seconds; no retry is
+            attempted if its delay would exceed the budget
         
     Returns:
         Wrapped function
@@ -88,6 +151,7 @@ def retry_operation(
     def wrapper(*args, **kwargs):
         current_delay = delay
         last_exception = None
+        deadline = time.monotonic() + timeout if timeout is not None else None
         
         for attempt in range(max_retries + 1):
             try:
@@ -95,22 +159,29 @@ def retry_operation(
             except exceptions as e:
                 last_exception = e
                 
-                if attempt == max_retries:
+                sleep_for = min(max_delay, current_delay) * (1 + random.random() * jitter)
+                out_of_time = (
+                    deadline is not None
+                    and time.monotonic() + sleep_for > deadline
+                )
+                
+                if attempt == max_retries or out_of_time:
                     logger.error(
-                        f"Operation failed after {max_retries} retries",
-                        function=func.__name__,
-                        error=str(e)
+                        f"Operation failed after {attempt} retries",
+                        extra={"function": func.__name__, "error": str(e)}
                     )
                     raise
                 
                 logger.warning(
-                    f"Operation failed, retrying in {current_delay:.2f}s",
-                    function=func.__name__,
-                    attempt=attempt + 1,
-                    error=str(e)
+                    f"Operation failed, retrying in {sleep_for:.2f}s",
+                    extra={
+                        "function": func.__name__,
+                        "attempt": attempt + 1,
+                        "error": str(e)
+                    }
                 )
                 
-                time.sleep(current_delay)
+                time.sleep(sleep_for)
                 current_delay *= backoff
         
         raise last_exception
@@ -118,19 +189,85 @@ def retry_operation(
     return wrapper
 
 
-def chunk_list(lst: List[T], chunk_size: int) -> Iterator[List[T]]:
+def _is_sliceable(obj: Any) -> bool:
+    """
+    Check whether an object supports len() and slicing.
+    
+    Covers registered Sequences plus sequence-like types that are not
+    registered with the ABC, such as array.array and numpy arrays.
+    
+    Args:
+        obj: Object to check
+        
+    Returns:
+        True if the object can be chunked by slicing
+    """
+    if isinstance(obj, Sequence):
+        return True
+    
+    cls = type(obj)
+    return (
+        not isinstance(obj, Mapping)
+        and hasattr(cls, "__getitem__")
+        and hasattr(cls, "__len__")
+    )
+
+
+def chunk_list(lst: Iterable[T], chunk_size: int) -> Iterator[List[T]]:
     """
-    Split a list into chunks.
+    Split a list (or any iterable) into chunks.
+    
+    Sequences (lists, tuples, strings, ranges, ...) are sliced directly, so
+    each chunk has the input's own type; other iterables, such as
+    generators, are consumed lazily in list chunks so they never need to be
+    materialized in full. Byte-like inputs are delegated to chunk_bytes.
     
     Args:
-        lst: List to split
+        lst: Sequence or iterable to split
         chunk_size: Size of each chunk
         
     Yields:
-        List chunks
+        Slices of a sequence, list chunks of other iterables, or memoryview
+        chunks of byte-like inputs
+    """
+    if isinstance(lst, (bytes, bytearray, memoryview)):
+        yield from chunk_bytes(lst, chunk_size)
+        return
+    
+    if _is_sliceable(lst):
+        for i in range(0, len(lst), chunk_size):
+            yield lst[i:i + chunk_size]
+        return
+    
+    iterator = iter(lst)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def chunk_bytes(
+    buf: Union[bytes, bytearray, memoryview],
+    chunk_size: int
+) -> Iterator[memoryview]:
+    """
+    Split a byte buffer into chunks without copying.
+    
+    Each chunk is a memoryview slice sharing the underlying buffer; call
+    ``bytes(chunk)`` if a chunk must outlive or be independent of it.
+    
+    Args:
+        buf: Bytes-like object to split
+        chunk_size: Size of each chunk in bytes
+        
+    Yields:
+        memoryview chunks
     """
-    for i in range(0, len(lst), chunk_size):
-        yield lst[i:i + chunk_size]
+    view = memoryview(buf).cast("B")
+    
+    for i in range(0, len(view), chunk_size):
+        yield view[i:i + chunk_size]
 
 
 def flatten_dict(
@@ -143,7 +280,7 @@ def flatten_dict(
     
     Args:
         d: Dictionary to flatten
-        parent_key: Parent key for recursion
+        parent_key: Prefix for all generated keys
         sep: Separator for keys
         
     Returns:
@@ -151,19 +288,32 @@ def flatten_dict(
     """
     items = {}
     
-    for key, value in d.items():
-        new_key = f"{parent_key}{sep}{key}" if parent_key else key
+    # Explicit stack of (head, iterator, tail) frames; child keys are built
+    # as f"{head}{key}{tail}", with head/tail joined once per frame rather
+    # than per key. A head of None means keys are used as-is (no prefix),
+    # and a non-empty tail marks a list frame. Walking iterators keeps the
+    # same depth-first key order as recursion would.
+    root_head = f"{parent_key}{sep}" if parent_key else None
+    stack = [(root_head, iter(d.items()), "")]
+    
+    while stack:
+        head, entries, tail = stack[-1]
         
-        if isinstance(value, dict):
-            items.update(flatten_dict(value, new_key, sep))
-        elif isinstance(value, list):
-            for i, v in enumerate(value):
-                if isinstance(v, dict):
-                    items.update(flatten_dict(v, f"{new_key}[{i}]", sep))
-                else:
-                    items[f"{new_key}[{i}]"] = v
-        else:
+        for key, value in entries:
+            new_key = key if head is None else f"{head}{key}{tail}"
+            value_type = type(value)
+            
+            if value_type is dict:
+                child_head = f"{new_key}{sep}" if new_key else None
+                stack.append((child_head, iter(value.items()), ""))
+                break
+            if value_type is list and not tail:
+                stack.append((f"{new_key}[", enumerate(value), "]"))
+                break
+            
             items[new_key] = value
+        else:
+            stack.pop()
     
     return items
 
@@ -184,11 +334,22 @@ def deep_merge(
     """
     result = base.copy()
     
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
-        else:
-            result[key] = value
+    # Walk (destination, source) pairs with an explicit stack. Nested dicts
+    # from ``base`` are copied only when something is merged into them, so
+    # neither input is ever mutated.
+    stack = [(result, override)]
+    
+    while stack:
+        dst, src = stack.pop()
+        
+        for key, value in src.items():
+            current = dst.get(key)
+            
+            if type(value) is dict and type(current) is dict:
+                current = dst[key] = current.copy()
+                stack.append((current, value))
+            else:
+                dst[key] = value
     
     return result
 
@@ -201,14 +362,63 @@ def remove_none_values(d: Dict[str, Any]) -> Dict[str, Any]:
         d: Dictionary to process
         
     Returns:
-        Dictionary without None values
+        Dictionary without None values. The input itself is returned when
+        it contains no None values, so copy it before mutating the result.
     """
-    return {k: v for k, v in d.items() if v is not None}
+    for v in d.values():
+        if v is None:
+            return {k: v for k, v in d.items() if v is not None}
+    
+    return d
+
+
+def remove_none_values_deep(value: Any) -> Any:
+    """
+    Recursively remove None values from nested dicts and lists.
+    
+    Containers without any None values are returned as-is, so unchanged
+    subtrees are shared with the input rather than copied.
+    
+    Args:
+        value: Dictionary, list or scalar to process
+        
+    Returns:
+        Value without None entries in any nested dict or list
+    """
+    if isinstance(value, dict):
+        result = None
+        
+        for index, (k, v) in enumerate(value.items()):
+            cleaned = None if v is None else remove_none_values_deep(v)
+            
+            if result is None and (v is None or cleaned is not v):
+                # First change: copy the unchanged entries seen so far
+                result = dict(islice(value.items(), index))
+            
+            if result is not None and v is not None:
+                result[k] = cleaned
+        
+        return value if result is None else result
+    
+    if isinstance(value, list):
+        cleaned_items = [
+            remove_none_values_deep(item) for item in value if item is not None
+        ]
+        
+        if len(cleaned_items) == len(value) and all(
+            a is b for a, b in zip(cleaned_items, value)
+        ):
+            return value
+        
+        return cleaned_items
+    
+    return value
 
 
 def group_by(
     lst: List[T],
-    key_func: Callable[[T], Any]
+    key_func: Optional[Callable[[T], Any]] = None,
+    keys: Optional[Iterable[Any]] = None
 ) -> Dict[Any, List[T]]:
     """
     Group a list by a key function.
@@ -216,19 +426,28 @@ def group_by(
     Args:
         lst: List to group
         key_func: Function to extract grouping key
+        keys: Precomputed grouping keys, one per item (used instead of
+            key_func when the keys are already known)
         
     Returns:
         Dictionary of groups
-    """
-    groups = {}
-    
-    for item in lst:
-        key = key_func(item)
-        if key not in groups:
-            groups[key] = []
-        groups[key].append(item)
+        
+    Raises:
+        ValueError: If neither key_func nor keys is given, or if keys and
+            lst have different lengths
+    """
+    groups = defaultdict(list)
+    
+    if keys is not None:
+        for key, item in zip(keys, lst, strict=True):
+            groups[key].append(item)
+    elif key_func is not None:
+        for item in lst:
+            groups[key_func(item)].append(item)
+    else:
+        raise ValueError("Either key_func or keys must be provided")
     
-    return groups
+    return dict(groups)
 
 
 def sort_dict_by_keys(
@@ -244,8 +463,8 @@ def sort_dict_by_keys(
         
     Returns:
         Sorted dictionary
-    }
-    return dict(sorted(d.items(), key=lambda x: x[0], reverse=not ascending))
+    """
+    return {key: d[key] for key in sorted(d, reverse=not ascending)}
 
 
 def safe_get(
@@ -267,101 +486,198 @@ def safe_get(
     current = d
     
     for key in keys:
-        if isinstance(current, dict) and key in current:
-            current = current[key]
-        else:
+        # Exact-type check first; isinstance only for dict subclasses
+        if type(current) is not dict and not isinstance(current, dict):
+            return default
+        
+        current = current.get(key, _MISSING)
+        
+        if current is _MISSING:
             return default
     
     return current
 
 
-def classproperty(func: Callable) -> property:
+class classproperty:
     """
     Decorator for class properties.
     
-    Args:
-        func: Function to wrap
+    Usage:
+        class Config:
+            @classproperty
+            def name(cls):
+                return cls.__name__
+    """
+    
+    def __init__(self, fget: Callable):
+        """
+        Initialize with the getter.
         
-    Returns:
-        Property descriptor
+        Args:
+            fget: Function receiving the owner class
+        """
+        self.fget = fget
+        self.__doc__ = fget.__doc__
+    
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        """Return the getter's value for the owner class."""
+        if owner is None:
+            owner = type(instance)
+        return self.fget(owner)
+
+
+class SingletonMeta(type):
     """
-    return property(classmethod(func))
+    Metaclass that creates at most one instance per class.
+    
+    Usage:
+        class Registry(metaclass=SingletonMeta):
+            ...
+    """
+    
+    _instances: Dict[type, Any] = {}
+    _lock = threading.Lock()
+    
+    def __call__(cls, *args, **kwargs):
+        """Return the cached instance, creating it on first use."""
+        instance = SingletonMeta._instances.get(cls)
+        
+        if instance is None:
+            with SingletonMeta._lock:
+                instance = SingletonMeta._instances.get(cls)
+                if instance is None:
+                    instance = super().__call__(*args, **kwargs)
+                    SingletonMeta._instances[cls] = instance
+        
+        return instance
 
 
 def singleton(cls: type) -> type:
     """
     Decorator to make a class a singleton.
     
+    Returns a subclass using SingletonMeta, so the result is still a real
+    class: ``isinstance`` checks, ``super()`` calls and pickling keep
+    working.
+    
     Args:
         cls: Class to decorate
         
     Returns:
         Singleton class
     """
-    instances = {}
+    base_meta = type(cls)
     
-    @wraps(cls)
-    def wrapper(*args, **kwargs):
-        if cls not in instances:
-            instances[cls] = cls(*args, **kwargs)
-        return instances[cls]
+    if issubclass(base_meta, SingletonMeta):
+        return cls
     
-    return wrapper
-
-
-def memoize(func: Callable) -> Callable:
+    if base_meta is type:
+        meta = SingletonMeta
+    else:
+        meta = type(f"Singleton{base_meta.__name__}", (SingletonMeta, base_meta), {})
+    
+    return meta(
+        cls.__name__,
+        (cls,),
+        {
+            "__module__": cls.__module__,
+            "__qualname__": cls.__qualname__,
+            "__doc__": cls.__doc__
+        }
+    )
+
+
+def memoize(
+    func: Optional[Callable] = None,
+    *,
+    maxsize: Optional[int] = 1024,
+    typed: bool = False
+) -> Callable:
     """
-    Simple memoization decorator.
+    Bounded memoization decorator backed by functools.lru_cache.
+    
+    Can be used bare (``@memoize``) or with options
+    (``@memoize(maxsize=256)``). Pass ``maxsize=None`` for an unbounded
+    cache.
     
     Args:
         func: Function to memoize
+        maxsize: Maximum number of cached results
+        typed: Cache arguments of different types separately
         
     Returns:
-        Memoized function
+        Memoized function, or a decorator when called with options only
     """
-    cache = {}
+    decorator = lru_cache(maxsize=maxsize, typed=typed)
     
-    @wraps(func)
-    def wrapper(*args):
-        if args not in cache:
-            cache[args] = func(*args)
-        return cache[args]
-    
-    return wrapper
+    if func is None:
+        return decorator
+    return decorator(func)
 
 
 def rate_limiter(
     max_calls: int,
-    time_window: int = 60
+    time_window: int = 60,
+    key_func: Optional[Callable[..., Hashable]] = None
 ) -> Callable:
     """
     Decorator for rate limiting function calls.
     
+    Each decorated function gets its own limits. Calls are grouped by
+    ``key_func(*args, **kwargs)`` (e.g., a user or route identifier) so one
+    caller cannot exhaust another's budget; without a key function all
+    calls share a single window. Safe to use from multiple threads.
+    
     Args:
         max_calls: Maximum calls in time window
         time_window: Time window in seconds
+        key_func: Optional function mapping call arguments to a limit key
         
     Returns:
         Rate limiting decorator
     """
-    calls = []
-    
     def decorator(func: Callable) -> Callable:
+        # Per-key timestamps of recent calls, oldest first; each deque is
+        # never longer than max_calls
+        buckets: Dict[Hashable, deque] = {}
+        lock = threading.Lock()
+        next_sweep = time.monotonic() + time_window
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            now = time.time()
-            
-            # Remove old calls outside time window
-            calls[:] = [t for t in calls if now - t < time_window]
+            nonlocal next_sweep
+            key = key_func(*args, **kwargs) if key_func is not None else None
+            wait_time = 0.0
             
-            if len(calls) >= max_calls:
-                oldest = calls[0]
-                wait_time = time_window - (now - oldest)
+            with lock:
+                now = time.monotonic()
+                cutoff = now - time_window
+                
+                # Once per window, drop keys whose newest call has expired so
+                # idle callers do not accumulate for the life of the process
+                if now >= next_sweep:
+                    for stale_key in [k for k, q in buckets.items() if q[-1] <= cutoff]:
+                        del buckets[stale_key]
+                    next_sweep = now + time_window
+                
+                calls = buckets.get(key)
+                if calls is None:
+                    calls = buckets[key] = deque()
+                
+                # Remove old calls outside time window
+                while calls and calls[0] <= cutoff:
+                    calls.popleft()
                 
-                if wait_time > 0:
-                    time.sleep(wait_time)
+                if len(calls) >= max_calls:
+                    wait_time = max(0.0, calls.popleft() + time_window - now)
+                
+                # Reserve the slot before sleeping so the lock is not held
+                # while waiting
+                calls.append(now + wait_time)
+            
+            if wait_time > 0:
+                time.sleep(wait_time)
             
-            calls.append(time.time())
             return func(*args, **kwargs)
         
         return wrapper
@@ -381,9 +697,9 @@ def timer(func: Callable) -> Callable:
     """
     @wraps(func)
     def wrapper(*args, **kwargs):
-        start = time.time()
+        start = time.perf_counter()
         result = func(*args, **kwargs)
-        end = time.time()
+        end = time.perf_counter()
         
         logger.info(
             f"Function {func.__name__} took {(end - start) * 1000:.2f}ms"
@@ -398,6 +714,9 @@ def validate_types(**type_hints):
     """
     Decorator for runtime type validation.
     
+    The function signature is inspected once at decoration time; each call
+    reads checked arguments straight from ``args``/``kwargs``.
+    
     Args:
         **type_hints: Type hints for validation
         
@@ -405,22 +724,63 @@ def validate_types(**type_hints):
         Validation decorator
     """
     def decorator(func: Callable) -> Callable:
+        sig = inspect.signature(func)
+        
+        # (name, expected type, positional index, accepts keyword, default)
+        checks = []
+        needs_bind = False
+        
+        for index, param in enumerate(sig.parameters.values()):
+            expected_type = type_hints.get(param.name)
+            
+            if expected_type is None:
+                continue
+            
+            if param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+                needs_bind = True
+                break
+            
+            if param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD):
+                position = index
+            else:
+                position = None
+            
+            by_keyword = param.kind is not param.POSITIONAL_ONLY
+            default = None if param.default is param.empty else param.default
+            checks.append((param.name, expected_type, position, by_keyword, default))
+        
+        def check(name: str, expected_type: type, value: Any) -> None:
+            if value is not None and not isinstance(value, expected_type):
+                raise TypeError(
+                    f"Argument '{name}' must be {expected_type.__name__}, "
+                    f"got {type(value).__name__}"
+                )
+        
+        if needs_bind:
+            # *args/**kwargs hints need full binding to collect their values
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                bound = sig.bind(*args, **kwargs)
+                bound.apply_defaults()
+                
+                for name, expected_type in type_hints.items():
+                    check(name, expected_type, bound.arguments.get(name))
+                
+                return func(*args, **kwargs)
+            
+            return wrapper
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            # Get function signature
-            sig = inspect.signature(func)
-            bound = sig.bind(*args, **kwargs)
-            bound.apply_defaults()
-            
-            # Validate types
-            for name, expected_type in type_hints.items():
-                value = bound.arguments.get(name)
+            for name, expected_type, position, by_keyword, default in checks:
+                if position is not None and position < len(args):
+                    value = args[position]
+                elif by_keyword:
+                    value = kwargs.get(name, default)
+                else:
+                    value = default
                 
-                if value is not None and not isinstance(value, expected_type):
-                    raise TypeError(
-                        f"Argument '{name}' must be {expected_type.__name__}, "
-                        f"got {type(value).__name__}"
-                    )
+                check(name, expected_type, value)
             
             return func(*args, **kwargs)
         
@@ -432,6 +792,9 @@ def validate_types(**type_hints):
 class LazyLoader:
     """
     Lazy loader for expensive imports.
+    
+    Resolved attributes are cached on the instance, so only the first
+    access to each name goes through ``__getattr__``.
     """
     
     def __init__(self, import_path: str):
@@ -443,16 +806,38 @@ class LazyLoader:
         """
         self.import_path = import_path
         self._module = None
+        self._lock = threading.Lock()
+    
+    def _load(self) -> Any:
+        """Import the module once, even under concurrent first access."""
+        module = self._module
+        
+        if module is None:
+            with self._lock:
+                module = self._module
+                if module is None:
+                    module = importlib.import_module(self.import_path)
+                    self._module = module
+        
+        return module
     
     def __getattr__(self, name: str) -> Any:
         """Lazy import and return attribute."""
-        if self._module is None:
-            import importlib
-            self._module = importlib.import_module(self.import_path)
+        # Guard against lookups before __init__ ran (e.g. while unpickling)
+        if name in ("import_path", "_module", "_lock"):
+            raise AttributeError(name)
         
-        return getattr(self._module, name)
+        attr = getattr(self._load(), name)
+        self.__dict__[name] = attr
+        return attr
+
+
+def _title_segment(match: "re.Match") -> str:
+    """Title-case the segment following an underscore."""
+    return match.group(1).title()
 
 
+@lru_cache(maxsize=4096)
 def to_camel_case(snake_str: str) -> str:
     """
     Convert snake_case to camelCase.
@@ -463,10 +848,10 @@ def to_camel_case(snake_str: str) -> str:
     Returns:
         Camel case string
     """
-    components = snake_str.split("_")
-    return components[0] + "".join(x.title() for x in components[1:])
+    return _SNAKE_SEGMENT_RE.sub(_title_segment, snake_str)
 
 
+@lru_cache(maxsize=4096)
 def to_snake_case(camel_str: str) -> str:
     """
     Convert camelCase to snake_case.
@@ -477,14 +862,28 @@ def to_snake_case(camel_str: str) -> str:
     Returns:
         Snake case string
     """
-    s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", camel_str)
-    return re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
+    s1 = _CAMEL_WORD_RE.sub(r"\1_\2", camel_str)
+    return _CAMEL_BOUNDARY_RE.sub(r"\1_\2", s1).lower()
+
+
+def _default_serializer(o: Any) -> Any:
+    """Fallback encoder for stdlib json: datetimes become ISO strings."""
+    if isinstance(o, datetime):
+        return o.isoformat()
+    raise TypeError(f"Object of type {type(o)} is not JSON serializable")
 
 
 def json_dumps(obj: Any, **kwargs) -> str:
     """
     Custom JSON serialization with datetime support.
     
+    Uses orjson, which encodes datetimes natively, when it is installed and
+    only ``indent=2``/``sort_keys`` are requested. Other keyword arguments,
+    and values orjson rejects (such as integers wider than 64 bits), fall
+    back to the stdlib encoder. Unlike the stdlib encoder, the orjson path
+    writes NaN and infinities as ``null`` (valid JSON) rather than the
+    non-standard ``NaN``/``Infinity`` tokens.
+    
     Args:
         obj: Object to serialize
         **kwargs: Additional JSON arguments
@@ -492,9 +891,19 @@ def json_dumps(obj: Any, **kwargs) -> str:
     Returns:
         JSON string
     """
-    def default_serializer(o):
-        if isinstance(o, datetime):
-            return o.isoformat()
-        raise TypeError(f"Object of type {type(o)} is not JSON serializable")
+    if orjson is not None and kwargs.keys() <= {"indent", "sort_keys"}:
+        option = orjson.OPT_NON_STR_KEYS
+        indent = kwargs.get("indent")
+        
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        if kwargs.get("sort_keys"):
+            option |= orjson.OPT_SORT_KEYS
+        
+        if indent is None or indent == 2:
+            try:
+                return orjson.dumps(obj, option=option).decode()
+            except orjson.JSONEncodeError:
+                pass
     
-    return json.dumps(obj, default=default_serializer, **kwargs)
+    return json.dumps(obj, default=_default_serializer, **kwargs)
@@ -14,14 +14,48 @@ from datetime import datetime
 from functools import wraps
 from typing import Any, Callable, Dict, Optional
 import json
-import traceback
 
 import structlog
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
 
 # Global log level configuration
 LOG_LEVEL = logging.INFO
 
+# Event names emitted by log_performance
+_PERF_STARTING = "Performance: starting"
+_PERF_COMPLETED = "Performance: completed"
+_PERF_FAILED = "Performance: failed"
+
+
+def _orjson_serializer(obj: Any, **kwargs: Any) -> str:
+    """
+    Serialize a log event with orjson.
+    
+    The stdlib handlers expect str messages, so the bytes are decoded.
+    Values orjson rejects (such as integers wider than 64 bits) fall back
+    to the stdlib encoder so the logging call never fails.
+    
+    Args:
+        obj: Event dictionary
+        **kwargs: Options passed by JSONRenderer
+        
+    Returns:
+        JSON string
+    """
+    try:
+        return orjson.dumps(
+            obj,
+            default=kwargs.get("default"),
+            option=orjson.OPT_NON_STR_KEYS
+        ).decode()
+    except TypeError:
+        return json.dumps(obj, **kwargs)
+
 
 def setup_logging(
     level: int = LOG_LEVEL,
@@ -36,6 +70,15 @@ def setup_logging(
         format_type: Output format ("json" or "plain")
         service_name: Name of the service for log context
     """
+    if format_type == "json":
+        renderer = (
+            structlog.processors.JSONRenderer(serializer=_orjson_serializer)
+            if orjson is not None
+            else structlog.processors.JSONRenderer()
+        )
+    else:
+        renderer = structlog.dev.ConsoleRenderer()
+    
     # Configure structlog
     structlog.configure(
         processors=[
@@ -47,8 +90,7 @@ def setup_logging(
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
             structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer() if format_type == "json"
-            else structlog.dev.ConsoleRenderer()
+            renderer
         ],
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
@@ -82,6 +124,23 @@ def get_logger(name: str) -> structlog.stdlib.BoundLogger:
     return structlog.get_logger(name)
 
 
+def _info_enabled(logger: Any) -> bool:
+    """
+    Check whether a logger would emit INFO events.
+    
+    Loggers without ``isEnabledFor`` (non-stdlib structlog wrappers) are
+    assumed to be enabled.
+    
+    Args:
+        logger: Logger instance
+        
+    Returns:
+        True if INFO events are emitted
+    """
+    is_enabled_for = getattr(logger, "isEnabledFor", None)
+    return is_enabled_for is None or is_enabled_for(logging.INFO)
+
+
 class LogContext:
     """
     Context manager for adding temporary context to logs.
@@ -94,16 +153,19 @@ class LogContext:
     def __init__(self, **context: Any):
         """Initialize context with key-value pairs."""
         self.context = context
-        self.token = None
+        self._keys = tuple(context)
+        self._bound = False
     
     def __enter__(self) -> None:
         """Enter context and bind variables."""
-        self.token = structlog.contextvars.bind_contextvars(**self.context)
+        structlog.contextvars.bind_contextvars(**self.context)
+        self._bound = True
     
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """Exit context and unbind variables."""
-        if self.token:
-            structlog.contextvars.unbind_contextvars(*self.context.keys())
+        if self._bound:
+            structlog.contextvars.unbind_contextvars(*self._keys)
+            self._bound = False
 
 
 def log_function(
@@ -125,57 +187,61 @@ def log_function(
         Decorated function
     """
     def decorator(func: Callable) -> Callable:
+        _logger = logger or get_logger(func.__module__)
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            _logger = logger or get_logger(func.__module__)
+            info_enabled = _info_enabled(_logger)
             
             # Start timing
-            start_time = time.time()
+            start_time = time.perf_counter() if log_duration else None
             
             # Log function call
-            call_info = {"function": func.__name__}
-            if log_args:
-                call_info["args"] = str(args)[:200]
-                call_info["kwargs"] = str(kwargs)[:200]
-            
-            _logger.info("Function called", **call_info)
+            if info_enabled:
+                call_info = {"function": func.__name__}
+                if log_args:
+                    call_info["args"] = str(args)[:200]
+                    call_info["kwargs"] = str(kwargs)[:200]
+                
+                _logger.info("Function called", **call_info)
             
             try:
                 # Execute function
                 result = func(*args, **kwargs)
                 
-                # Calculate duration
-                duration_ms = (time.time() - start_time) * 1000
+            except Exception as e:
+                # Log error
+                error_info = {
+                    "function": func.__name__,
+                    "error": str(e),
+                    "error_type": type(e).__name__
+                }
+                
+                if log_duration:
+                    duration_ms = (time.perf_counter() - start_time) * 1000
+                    error_info["duration_ms"] = round(duration_ms, 2)
+                
+                _logger.error("Function failed", exc_info=True, **error_info)
                 
-                # Log success
+                raise
+            
+            # Log success
+            if info_enabled:
                 success_info = {
                     "function": func.__name__,
-                    "duration_ms": round(duration_ms, 2),
                     "status": "success"
                 }
                 
+                if log_duration:
+                    duration_ms = (time.perf_counter() - start_time) * 1000
+                    success_info["duration_ms"] = round(duration_ms, 2)
+                
                 if log_result:
                     success_info["result"] = str(result)[:200]
                 
                 _logger.info("Function completed", **success_info)
-                
-                return result
-                
-            except Exception as e:
-                # Calculate duration
-                duration_ms = (time.time() - start_time) * 1000
-                
-                # Log error
-                _logger.error(
-                    "Function failed",
-                    function=func.__name__,
-                    duration_ms=round(duration_ms, 2),
-                    error=str(e),
-                    error_type=type(e).__name__,
-                    traceback=traceback.format_exc()
-                )
-                
-                raise
+            
+            return result
         
         return wrapper
     return decorator
@@ -271,28 +337,32 @@ def log_performance(operation: str, logger: Optional[structlog.stdlib.BoundLogge
         Decorated function
     """
     def decorator(func: Callable) -> Callable:
+        _logger = logger or get_logger(func.__module__)
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            _logger = logger or get_logger(func.__module__)
+            info_enabled = _info_enabled(_logger)
             
-            start_time = time.time()
-            _logger.info("Performance: starting", operation=operation)
+            start_time = time.perf_counter()
+            if info_enabled:
+                _logger.info(_PERF_STARTING, operation=operation)
             
             try:
                 result = func(*args, **kwargs)
                 
-                duration_ms = (time.time() - start_time) * 1000
-                _logger.info(
-                    "Performance: completed",
-                    operation=operation,
-                    duration_ms=round(duration_ms, 2)
-                )
+                if info_enabled:
+                    duration_ms = (time.perf_counter() - start_time) * 1000
+                    _logger.info(
+                        _PERF_COMPLETED,
+                        operation=operation,
+                        duration_ms=round(duration_ms, 2)
+                    )
                 
                 return result
             except Exception as e:
-                duration_ms = (time.time() - start_time) * 1000
+                duration_ms = (time.perf_counter() - start_time) * 1000
                 _logger.error(
-                    "Performance: failed",
+                    _PERF_FAILED,
                     operation=operation,
                     duration_ms=round(duration_ms, 2),
                     error=str(e)
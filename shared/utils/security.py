@@ -6,29 +6,106 @@ MathVerse platform, including JWT token handling, password hashing,
 and data encryption.
 """
 
+import asyncio
+import copy
 import secrets
 import hashlib
 import hmac
 import base64
+import calendar
+import json
 import os
+import struct
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Iterable, Optional, Tuple
 from enum import Enum
 
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from jose import JWTError, jwt
 from passlib.context import CryptContext
-import cryptocompare
-
-
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+# Password hashing configuration (argon2id cost for new hashes)
+ARGON2_MEMORY_COST = int(os.getenv("ARGON2_MEMORY_COST", "65536"))  # KiB
+ARGON2_TIME_COST = int(os.getenv("ARGON2_TIME_COST", "2"))
+
+# Password hashing context: new hashes use argon2id; existing bcrypt hashes
+# still verify and are flagged for rehashing by password_needs_rehash()
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    default="argon2",
+    deprecated=["bcrypt"],
+    argon2__type="ID",
+    argon2__memory_cost=ARGON2_MEMORY_COST,
+    argon2__time_cost=ARGON2_TIME_COST,
+    argon2__parallelism=1
+)
+
+# Worker threads for password hashing; the argon2/bcrypt backends release
+# the GIL, so verifications run in parallel off the event loop
+_PASSWORD_HASH_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix="password-hash"
+)
 
 # JWT configuration
 JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", secrets.token_hex(32))
+
+# Constant base64url JOSE header for inline HS256 signing
+_HS256_HEADER = base64.urlsafe_b64encode(b'{"alg":"HS256","typ":"JWT"}').rstrip(b"=")
+
+# Registered claims encoded as NumericDate (RFC 7519 section 4.1)
+_JWT_TIME_CLAIMS = ("exp", "iat", "nbf")
 JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 JWT_ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("JWT_ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
 JWT_REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("JWT_REFRESH_TOKEN_EXPIRE_DAYS", "7"))
 
+# Server-side pepper for API key secret hashes. It must be stable across
+# restarts and workers, and independent of the JWT key so rotating that key
+# does not invalidate stored API keys; there is deliberately no default.
+API_KEY_PEPPER = os.getenv("API_KEY_PEPPER")
+
+# Keyed HMAC-SHA256 prototypes for the module's own secrets; copying one
+# skips the ipad/opad key schedule on every token and API key hash
+_MODULE_HMACS: Dict[bytes, "hmac.HMAC"] = {
+    secret.encode(): hmac.new(secret.encode(), digestmod=hashlib.sha256)
+    for secret in (JWT_SECRET_KEY, API_KEY_PEPPER)
+    if secret
+}
+
+# Verified-token cache, keyed by the SHA-256 digest of the token
+_VERIFY_CACHE_MAX_ENTRIES = 10000
+_VERIFY_CACHE_TTL = 5.0  # seconds
+_verify_cache: "OrderedDict[bytes, Tuple[Dict[str, Any], float]]" = OrderedDict()
+_verify_cache_lock = threading.Lock()
+
+# Characters used for numeric one-time passwords
+_OTP_DIGITS = "0123456789"
+
+# OTP storage suffix: creation time as a big-endian uint32 Unix timestamp
+_OTP_TIMESTAMP = struct.Struct("!I")
+
+# AES-GCM nonce length in bytes (96 bits, as recommended for GCM)
+_GCM_NONCE_SIZE = 12
+
+# Claims enforced inside the single verified decode in verify_token
+_VERIFY_OPTIONS = {
+    "verify_exp": True,
+    "require_exp": True,
+    "require_iat": True,
+    "require_sub": True
+}
+
 
 class TokenType(str, Enum):
     """JWT token types."""
@@ -52,6 +129,44 @@ class TokenPayload(BaseModel):
     permissions: Optional[list] = None
 
 
+def _encode_jwt(payload: Dict[str, Any]) -> str:
+    """
+    Sign a JWT payload.
+    
+    HS256 tokens are built directly from the constant header and a keyed
+    HMAC prototype for the current JWT_SECRET_KEY; other algorithms go
+    through python-jose. As in jose, datetime ``exp``/``iat``/``nbf``
+    claims are converted to NumericDate ints.
+    
+    Args:
+        payload: JWT claims
+        
+    Returns:
+        Encoded JWT token string
+    """
+    if JWT_ALGORITHM != "HS256":
+        return jwt.encode(payload, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
+    
+    for claim in _JWT_TIME_CLAIMS:
+        value = payload.get(claim)
+        if isinstance(value, datetime):
+            payload = {**payload, claim: calendar.timegm(value.utctimetuple())}
+    
+    if orjson is not None:
+        claims = orjson.dumps(payload, option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z)
+    else:
+        claims = json.dumps(payload, separators=(",", ":")).encode()
+    payload_b64 = base64.urlsafe_b64encode(claims).rstrip(b"=")
+    signing_input = _HS256_HEADER + b"." + payload_b64
+    
+    # Looked up per call so a changed JWT_SECRET_KEY (e.g. in tests) is honoured
+    signer = _module_hmac(JWT_SECRET_KEY)
+    signer.update(signing_input)
+    signature = base64.urlsafe_b64encode(signer.digest()).rstrip(b"=")
+    
+    return (signing_input + b"." + signature).decode()
+
+
 def create_access_token(
     user_id: str,
     email: Optional[str] = None,
@@ -74,12 +189,12 @@ def create_access_token(
     Returns:
         Encoded JWT token string
     """
+    now = int(time.time())
+    
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = now + int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(minutes=JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
-    
-    now = datetime.utcnow()
+        expire = now + JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60
     
     payload = {
         "sub": user_id,
@@ -95,8 +210,7 @@ def create_access_token(
     if additional_claims:
         payload.update(additional_claims)
     
-    encoded_jwt = jwt.encode(payload, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
-    return encoded_jwt
+    return _encode_jwt(payload)
 
 
 def create_refresh_token(
@@ -113,8 +227,8 @@ def create_refresh_token(
     Returns:
         Encoded JWT refresh token string
     """
-    expire = datetime.utcnow() + timedelta(days=JWT_REFRESH_TOKEN_EXPIRE_DAYS)
-    now = datetime.utcnow()
+    now = int(time.time())
+    expire = now + JWT_REFRESH_TOKEN_EXPIRE_DAYS * 86400
     
     payload = {
         "sub": user_id,
@@ -125,8 +239,7 @@ def create_refresh_token(
         "email": email
     }
     
-    encoded_jwt = jwt.encode(payload, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
-    return encoded_jwt
+    return _encode_jwt(payload)
 
 
 def create_verify_token(user_id: str, email: str) -> str:
@@ -140,8 +253,8 @@ def create_verify_token(user_id: str, email: str) -> str:
     Returns:
         Encoded verification token
     """
-    expire = datetime.utcnow() + timedelta(hours=24)
-    now = datetime.utcnow()
+    now = int(time.time())
+    expire = now + 24 * 3600
     
     payload = {
         "sub": user_id,
@@ -152,8 +265,7 @@ def create_verify_token(user_id: str, email: str) -> str:
         "email": email
     }
     
-    encoded_jwt = jwt.encode(payload, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
-    return encoded_jwt
+    return _encode_jwt(payload)
 
 
 def create_password_reset_token(user_id: str) -> str:
@@ -166,8 +278,8 @@ def create_password_reset_token(user_id: str) -> str:
     Returns:
         Encoded reset token
     """
-    expire = datetime.utcnow() + timedelta(hours=1)
-    now = datetime.utcnow()
+    now = int(time.time())
+    expire = now + 3600
     
     payload = {
         "sub": user_id,
@@ -177,14 +289,23 @@ def create_password_reset_token(user_id: str) -> str:
         "jti": secrets.token_hex(8)
     }
     
-    encoded_jwt = jwt.encode(payload, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
-    return encoded_jwt
+    return _encode_jwt(payload)
+
+
+def _token_cache_key(token: str) -> bytes:
+    """Digest a token so the raw bearer credential is never stored."""
+    return hashlib.sha256(token.encode()).digest()
 
 
 def verify_token(token: str, expected_type: TokenType = TokenType.ACCESS) -> Optional[Dict[str, Any]]:
     """
     Verify and decode a JWT token.
     
+    Successful verifications are cached for a few seconds (never past the
+    token's own expiry), so a client presenting the same bearer token
+    repeatedly skips the signature check. Failed verifications are never
+    cached, and every call returns an independent copy of the payload.
+    
     Args:
         token: JWT token string
         expected_type: Expected token type
@@ -192,28 +313,79 @@ def verify_token(token: str, expected_type: TokenType = TokenType.ACCESS) -> Opt
     Returns:
         Decoded token payload or None if invalid
     """
+    key = _token_cache_key(token)
+    now = time.time()
+    cached_payload = None
+    
+    with _verify_cache_lock:
+        cached = _verify_cache.get(key)
+        
+        if cached is not None:
+            if cached[1] > now:
+                _verify_cache.move_to_end(key)
+                cached_payload = cached[0]
+            else:
+                del _verify_cache[key]
+    
+    if cached_payload is not None:
+        if cached_payload.get("type") != expected_type.value:
+            return None
+        # Cached payloads are never mutated; callers get their own deep copy
+        # so editing nested claims cannot leak into later hits
+        return copy.deepcopy(cached_payload)
+    
     try:
         payload = jwt.decode(
             token,
             JWT_SECRET_KEY,
-            algorithms=[JWT_ALGORITHM]
+            algorithms=[JWT_ALGORITHM],
+            options=_VERIFY_OPTIONS
         )
-        
-        # Verify token type
-        token_type = payload.get("type")
-        if token_type != expected_type.value:
-            return None
-        
-        return payload
-        
     except JWTError:
         return None
+    
+    # "type" is not a registered claim, so jose cannot require it
+    if "type" not in payload:
+        return None
+    
+    expires_at = now + _VERIFY_CACHE_TTL
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        expires_at = min(expires_at, exp)
+    
+    with _verify_cache_lock:
+        _verify_cache[key] = (payload, expires_at)
+        _verify_cache.move_to_end(key)
+        
+        if len(_verify_cache) > _VERIFY_CACHE_MAX_ENTRIES:
+            _verify_cache.popitem(last=False)
+    
+    # Verify token type
+    if payload.get("type") != expected_type.value:
+        return None
+    
+    return copy.deepcopy(payload)
+
+
+def invalidate_token(token: str) -> None:
+    """
+    Drop a token from the verification cache (e.g. on logout).
+    
+    Args:
+        token: JWT token string
+    """
+    with _verify_cache_lock:
+        _verify_cache.pop(_token_cache_key(token), None)
 
 
 def decode_token(token: str) -> Optional[Dict[str, Any]]:
     """
     Decode a JWT token without verification (for inspection).
     
+    Admin/debug use only: this skips the expiry check and the verification
+    cache. Request authentication should call verify_token, which decodes
+    and checks claims in a single pass.
+    
     Args:
         token: JWT token string
         
@@ -233,7 +405,7 @@ def decode_token(token: str) -> Optional[Dict[str, Any]]:
 
 def hash_password(password: str) -> str:
     """
-    Hash a password using bcrypt.
+    Hash a password using argon2id.
     
     Args:
         password: Plain text password
@@ -258,6 +430,45 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password without blocking the event loop.
+    
+    Runs verify_password in a dedicated thread pool sized to the CPU count,
+    so a burst of logins uses every core instead of stalling other requests.
+    
+    Args:
+        plain_password: Plain text password
+        hashed_password: Stored password hash
+        
+    Returns:
+        True if password matches
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _PASSWORD_HASH_POOL,
+        pwd_context.verify,
+        plain_password,
+        hashed_password
+    )
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Check whether a stored hash should be replaced on next login.
+    
+    True for legacy bcrypt hashes and for argon2 hashes made with
+    different parameters.
+    
+    Args:
+        hashed_password: Stored password hash
+        
+    Returns:
+        True if the password should be rehashed with hash_password
+    """
+    return pwd_context.needs_update(hashed_password)
+
+
 def generate_secret_key(length: int = 32) -> str:
     """
     Generate a secure random secret key.
@@ -291,69 +502,97 @@ def hash_api_key_secret(secret: str) -> str:
     """
     Hash an API key secret for storage.
     
+    API key secrets carry 192 bits of randomness, so a peppered
+    HMAC-SHA256 is enough; bcrypt's key stretching only adds latency.
+    
     Args:
         secret: Plain text secret
         
     Returns:
-        Hashed secret
+        Hex-encoded secret hash
+        
+    Raises:
+        RuntimeError: If API_KEY_PEPPER is not configured
     """
-    return hash_password(secret)
+    if not API_KEY_PEPPER:
+        raise RuntimeError(
+            "API_KEY_PEPPER must be set to hash or verify API key secrets"
+        )
+    
+    signer = _module_hmac(API_KEY_PEPPER)
+    signer.update(secret.encode())
+    return signer.hexdigest()
 
 
-def encrypt_data(data: str, key: Optional[bytes] = None) -> str:
+def verify_api_key_secret(secret: str, hashed_secret: str) -> bool:
     """
-    Encrypt data using AES-256-CBC.
+    Verify an API key secret against its stored hash.
     
     Args:
-        data: Plain text data to encrypt
-        key: Encryption key (generated if not provided)
+        secret: Plain text secret
+        hashed_secret: Hash from hash_api_key_secret
         
     Returns:
-        Base64-encoded encrypted data with IV
+        True if the secret matches
+        
+    Raises:
+        RuntimeError: If API_KEY_PEPPER is not configured
     """
-    if key is None:
-        key = generate_secret_key(32).encode()
-    
-    iv = os.urandom(16)
-    cipher = cryptocompare.new(key, cryptocompare.MODE_CBC, iv)
-    
-    # Pad data to block size
-    padding_length = 16 - len(data) % 16
-    padded_data = data + chr(padding_length) * padding_length
+    return hmac.compare_digest(hash_api_key_secret(secret), hashed_secret)
+
+
+def encrypt_data(
+    data: str,
+    key: bytes,
+    associated_data: Optional[bytes] = None
+) -> str:
+    """
+    Encrypt data using AES-256-GCM.
     
-    encrypted = cipher.encrypt(padded_data.encode())
+    GCM authenticates the ciphertext, so tampering is detected on
+    decryption without a separate HMAC.
     
-    # Combine IV and encrypted data
-    combined = iv + encrypted
+    Args:
+        data: Plain text data to encrypt
+        key: 32-byte encryption key (e.g. from AESGCM.generate_key); the
+            same key is needed to decrypt
+        associated_data: Optional data authenticated but not encrypted
+        
+    Returns:
+        Base64-encoded nonce, ciphertext and tag
+    """
+    nonce = os.urandom(_GCM_NONCE_SIZE)
+    encrypted = AESGCM(key).encrypt(nonce, data.encode(), associated_data)
     
-    return base64.b64encode(combined).decode()
+    # nonce || ciphertext || tag
+    return base64.b64encode(nonce + encrypted).decode()
 
 
-def decrypt_data(encrypted_data: str, key: bytes) -> str:
+def decrypt_data(
+    encrypted_data: str,
+    key: bytes,
+    associated_data: Optional[bytes] = None
+) -> str:
     """
-    Decrypt AES-256-CBC encrypted data.
+    Decrypt AES-256-GCM encrypted data.
     
     Args:
         encrypted_data: Base64-encoded encrypted data
         key: Decryption key
+        associated_data: Associated data passed to encrypt_data
         
     Returns:
         Decrypted plain text
+        
+    Raises:
+        cryptography.exceptions.InvalidTag: If the data or key is wrong
     """
     combined = base64.b64decode(encrypted_data.encode())
     
-    iv = combined[:16]
-    encrypted = combined[16:]
-    
-    cipher = cryptocompare.new(key, cryptocompare.MODE_CBC, iv)
+    nonce = combined[:_GCM_NONCE_SIZE]
+    encrypted = combined[_GCM_NONCE_SIZE:]
     
-    decrypted = cipher.decrypt(encrypted)
-    
-    # Remove padding
-    padding_length = decrypted[-1]
-    plain_text = decrypted[:-padding_length].decode()
-    
-    return plain_text
+    return AESGCM(key).decrypt(nonce, encrypted, associated_data).decode()
 
 
 def generate_otp(length: int = 6) -> str:
@@ -366,7 +605,18 @@ def generate_otp(length: int = 6) -> str:
     Returns:
         OTP string
     """
-    return ''.join(str(secrets.randbelow(10)) for _ in range(length))
+    digits = []
+    
+    while len(digits) < length:
+        # Oversample so one draw almost always suffices; bytes >= 250 are
+        # rejected to keep every digit equally likely
+        digits.extend(
+            _OTP_DIGITS[b % 10]
+            for b in secrets.token_bytes(length * 2)
+            if b < 250
+        )
+    
+    return "".join(digits[:length])
 
 
 def verify_otp(otp: str, stored_otp: str, expiry_seconds: int = 300) -> bool:
@@ -375,22 +625,22 @@ def verify_otp(otp: str, stored_otp: str, expiry_seconds: int = 300) -> bool:
     
     Args:
         otp: User-provided OTP
-        stored_otp: Stored OTP with timestamp
+        stored_otp: Storage string from create_otp_storage
         expiry_seconds: OTP validity period
         
     Returns:
         True if OTP is valid
     """
     try:
-        stored_otp, timestamp_str = stored_otp.split("|")
-        timestamp = datetime.fromisoformat(timestamp_str)
+        raw = base64.b64decode(stored_otp)
+        (timestamp,) = _OTP_TIMESTAMP.unpack_from(raw, len(raw) - _OTP_TIMESTAMP.size)
         
         # Check expiry
-        if datetime.now() - timestamp > timedelta(seconds=expiry_seconds):
+        if time.time() - timestamp > expiry_seconds:
             return False
         
-        return secrets.compare_digest(otp, stored_otp)
-    except (ValueError, AttributeError):
+        return hmac.compare_digest(otp.encode(), raw[:-_OTP_TIMESTAMP.size])
+    except (ValueError, TypeError, AttributeError, struct.error):
         return False
 
 
@@ -398,13 +648,38 @@ def create_otp_storage(otp: str) -> str:
     """
     Create OTP storage string with timestamp.
     
+    The OTP bytes are followed by a big-endian uint32 Unix timestamp and
+    base64-encoded, so verification needs no date parsing.
+    
     Args:
         otp: OTP string
         
     Returns:
         Storage string with timestamp
     """
-    return f"{otp}|{datetime.now().isoformat()}"
+    return base64.b64encode(otp.encode() + _OTP_TIMESTAMP.pack(int(time.time()))).decode()
+
+
+def _module_hmac(secret: str) -> "hmac.HMAC":
+    """
+    Return a fresh HMAC-SHA256 keyed with one of the module's secrets.
+    
+    JWT_SECRET_KEY and API_KEY_PEPPER as loaded at import are copied from
+    their precomputed prototypes; a key replaced at runtime (e.g. in tests)
+    is keyed from scratch.
+    
+    Args:
+        secret: JWT_SECRET_KEY or API_KEY_PEPPER
+        
+    Returns:
+        HMAC object ready for update()
+    """
+    key = secret.encode()
+    prototype = _MODULE_HMACS.get(key)
+    
+    if prototype is None:
+        return hmac.new(key, digestmod=hashlib.sha256)
+    return prototype.copy()
 
 
 def hash_hmac(data: str, secret: str) -> str:
@@ -418,11 +693,7 @@ def hash_hmac(data: str, secret: str) -> str:
     Returns:
         Hex-encoded HMAC signature
     """
-    return hmac.new(
-        secret.encode(),
-        data.encode(),
-        hashlib.sha256
-    ).hexdigest()
+    return hmac.new(secret.encode(), data.encode(), hashlib.sha256).hexdigest()
 
 
 def verify_hmac(data: str, signature: str, secret: str) -> bool:
@@ -446,21 +717,18 @@ class PermissionChecker:
     Utility class for checking user permissions.
     """
     
-    def __init__(self, required_permissions: list):
+    def __init__(self, required_permissions: Iterable[str]):
         """Initialize with required permissions."""
-        self.required_permissions = required_permissions
+        self.required_permissions = frozenset(required_permissions)
     
-    def __call__(self, user_permissions: list) -> bool:
+    def __call__(self, user_permissions: Iterable[str]) -> bool:
         """
         Check if user has all required permissions.
         
         Args:
-            user_permissions: List of user permissions
+            user_permissions: User permissions (list, set or other iterable)
             
         Returns:
             True if user has all required permissions
         """
-        return all(
-            perm in user_permissions
-            for perm in self.required_permissions
-        )
+        return self.required_permissions.issubset(user_permissions)
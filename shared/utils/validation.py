@@ -5,16 +5,69 @@ This module provides input validation utilities for the MathVerse platform,
 including email validation, password strength checking, and data sanitization.
 """
 
+import html
 import re
-from typing import Optional, Tuple
+import string
+import threading
+import uuid
+from typing import Any, Collection, Dict, FrozenSet, Optional, Tuple
+from urllib.parse import urlsplit
 from email_validator import validate_email, EmailNotValidError
-import bleach
+from bleach.sanitizer import Cleaner
 
 
 # Password regex patterns
 PASSWORD_MIN_LENGTH = 8
 PASSWORD_MAX_LENGTH = 128
 
+# Password character classes, as bit flags
+_CLASS_UPPER = 1
+_CLASS_LOWER = 2
+_CLASS_DIGIT = 4
+_CLASS_SPECIAL = 8
+_PASSWORD_SPECIAL_CHARS = '!@#$%^&*(),.?":{}|<>'
+
+
+def _build_char_class_table() -> bytes:
+    """Build a bytes.translate table mapping each byte to its class flag."""
+    table = bytearray(256)
+    
+    for chars, flag in (
+        (string.ascii_uppercase, _CLASS_UPPER),
+        (string.ascii_lowercase, _CLASS_LOWER),
+        (string.digits, _CLASS_DIGIT),
+        (_PASSWORD_SPECIAL_CHARS, _CLASS_SPECIAL)
+    ):
+        for char in chars:
+            table[ord(char)] = flag
+    
+    return bytes(table)
+
+
+# Non-ASCII bytes (including UTF-8 continuation bytes) map to 0
+_CHAR_CLASS_TABLE = _build_char_class_table()
+
+# Precompiled patterns used by the validators below
+_NON_DIGIT_RE = re.compile(r"\D")
+# Only "<" followed by a letter, "/", "!" or "?" starts a tag, so text such
+# as "x < 5 and y > 3" is kept (and escaped) rather than stripped
+_HTML_TAG_RE = re.compile(r"<[A-Za-z/!?][^>]*>")
+
+# Default tag/attribute allow-lists for the HTML sanitizers
+_BASIC_FORMATTING_TAGS = frozenset(
+    ["b", "i", "u", "strong", "em", "p", "br", "ul", "ol", "li"]
+)
+_DEFAULT_HTML_ATTRIBUTES = {
+    "a": ["href", "title"],
+    "img": ["src", "alt", "width", "height"]
+}
+
+# bleach Cleaners keep parser state, so each thread gets its own; at most
+# _MAX_CLEANERS configurations are cached per thread
+_MAX_CLEANERS = 32
+_thread_cleaners = threading.local()
+_URL_SCHEMES = frozenset({"http", "https"})
+
 
 def validate_email(email_str: str) -> Tuple[bool, str]:
     """
@@ -60,17 +113,21 @@ def validate_password_strength(password: str) -> Tuple[bool, str]:
     if len(password) > PASSWORD_MAX_LENGTH:
         errors.append(f"Password must not exceed {PASSWORD_MAX_LENGTH} characters")
     
-    # Complexity checks
-    if not re.search(r"[A-Z]", password):
+    # Complexity checks: classify every character in one C-level pass
+    classes = set(
+        password.encode("utf-8", "surrogatepass").translate(_CHAR_CLASS_TABLE)
+    )
+    
+    if _CLASS_UPPER not in classes:
         errors.append("Password must contain at least one uppercase letter")
     
-    if not re.search(r"[a-z]", password):
+    if _CLASS_LOWER not in classes:
         errors.append("Password must contain at least one lowercase letter")
     
-    if not re.search(r"[0-9]", password):
+    if _CLASS_DIGIT not in classes:
         errors.append("Password must contain at least one number")
     
-    if not re.search(r"[!@#$%^&*(),.?\":{}|<>]", password):
+    if _CLASS_SPECIAL not in classes:
         errors.append("Password must contain at least one special character")
     
     if errors:
@@ -89,11 +146,14 @@ def validate_uuid(value: str) -> bool:
     Returns:
         True if valid UUID
     """
-    uuid_pattern = re.compile(
-        r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
-        re.IGNORECASE
-    )
-    return bool(uuid_pattern.match(value))
+    try:
+        parsed = uuid.UUID(value)
+    except (ValueError, TypeError, AttributeError):
+        return False
+    
+    # uuid.UUID also accepts braces, URNs and missing hyphens; only the
+    # canonical hyphenated form is valid here
+    return len(value) == 36 and str(parsed) == value.lower()
 
 
 def validate_username(username: str) -> Tuple[bool, str]:
@@ -112,7 +172,10 @@ def validate_username(username: str) -> Tuple[bool, str]:
     if len(username) > 50:
         return False, "Username must not exceed 50 characters"
     
-    if not re.match(r"^[a-zA-Z0-9_]+$", username):
+    # ASCII letters, digits and underscores; an all-underscore name falls
+    # through to the underscore check below, as it did with the regex
+    alphanumeric = username.replace("_", "")
+    if not username.isascii() or (alphanumeric and not alphanumeric.isalnum()):
         return False, "Username can only contain letters, numbers, and underscores"
     
     if username.startswith("_") or username.endswith("_"):
@@ -132,7 +195,7 @@ def validate_phone_number(phone: str) -> Tuple[bool, str]:
         Tuple of (is_valid, normalized_number)
     """
     # Remove all non-digit characters
-    digits = re.sub(r"\D", "", phone)
+    digits = _NON_DIGIT_RE.sub("", phone)
     
     # Check for valid length (7-15 digits for international)
     if len(digits) < 7 or len(digits) > 15:
@@ -149,6 +212,58 @@ def validate_phone_number(phone: str) -> Tuple[bool, str]:
     return True, normalized
 
 
+def _get_cleaner(
+    tags: FrozenSet[str],
+    attributes: Optional[Dict[str, list]] = None
+) -> Cleaner:
+    """
+    Return this thread's cached bleach Cleaner for a configuration.
+    
+    Building a Cleaner sets up the html5lib parser and sanitizer filter,
+    so cleaners are reused across calls instead of created per call.
+    
+    Args:
+        tags: Allowed HTML tags
+        attributes: Dict of tag -> allowed attributes (bleach default if None)
+        
+    Returns:
+        Cleaner that strips disallowed tags
+    """
+    if attributes is not None and not all(
+        isinstance(allowed, (list, tuple)) for allowed in attributes.values()
+    ):
+        # Callable attribute filters can't be keyed reliably, so skip the cache
+        return Cleaner(tags=tags, strip=True, attributes=attributes)
+    
+    cache = getattr(_thread_cleaners, "cache", None)
+    if cache is None:
+        cache = _thread_cleaners.cache = {}
+    
+    attributes_key = None
+    if attributes is not None:
+        attributes_key = frozenset(
+            (tag, tuple(allowed)) for tag, allowed in attributes.items()
+        )
+    
+    key = (tags, attributes_key)
+    cleaner = cache.get(key)
+    
+    if cleaner is None:
+        options = {"tags": tags, "strip": True}
+        if attributes is not None:
+            # Private copy so later edits to the caller's dict can't leak
+            # into the cached cleaner
+            options["attributes"] = {
+                tag: list(allowed) for tag, allowed in attributes.items()
+            }
+        
+        cleaner = Cleaner(**options)
+        if len(cache) < _MAX_CLEANERS:
+            cache[key] = cleaner
+    
+    return cleaner
+
+
 def sanitize_input(
     text: str,
     allow_tags: Optional[list] = None,
@@ -157,6 +272,12 @@ def sanitize_input(
     """
     Sanitize user input to prevent XSS and injection attacks.
     
+    When stripping, tags are removed with a regex instead of bleach's
+    HTML parser, and the remaining text is re-escaped so no markup can
+    survive. A ``<`` only starts a tag when followed by a letter, ``/``,
+    ``!`` or ``?`` (so inequalities like ``x < 5`` are kept as text);
+    unlike bleach, unclosed tags are escaped rather than parsed.
+    
     Args:
         text: Input text to sanitize
         allow_tags: List of allowed HTML tags
@@ -166,16 +287,16 @@ def sanitize_input(
         Sanitized text
     """
     if strip:
-        # Strip all HTML tags
-        return bleach.clean(text, tags=[], strip=True)
+        # Strip all HTML tags, then escape whatever markup characters remain
+        stripped = _HTML_TAG_RE.sub("", text)
+        return html.escape(html.unescape(stripped), quote=False)
     
     if allow_tags:
         # Allow specific HTML tags
-        return bleach.clean(text, tags=allow_tags, strip=True)
+        return _get_cleaner(frozenset(allow_tags)).clean(text)
     
     # Default: allow basic formatting tags
-    allowed_tags = ["b", "i", "u", "strong", "em", "p", "br", "ul", "ol", "li"]
-    return bleach.clean(text, tags=allowed_tags, strip=True)
+    return _get_cleaner(_BASIC_FORMATTING_TAGS).clean(text)
 
 
 def sanitize_html(
@@ -193,17 +314,12 @@ def sanitize_html(
         Sanitized HTML
     """
     if allowed_attributes is None:
-        allowed_attributes = {
-            "a": ["href", "title"],
-            "img": ["src", "alt", "width", "height"]
-        }
+        allowed_attributes = _DEFAULT_HTML_ATTRIBUTES
     
-    return bleach.clean(
-        html,
-        tags=list(allowed_attributes.keys()),
-        attributes=allowed_attributes,
-        strip=True
-    )
+    return _get_cleaner(
+        frozenset(allowed_attributes),
+        allowed_attributes
+    ).clean(html)
 
 
 def validate_url(url: str) -> bool:
@@ -216,12 +332,35 @@ def validate_url(url: str) -> bool:
     Returns:
         True if valid URL format
     """
-    url_pattern = re.compile(
-        r"^(https?:\/\/)?"
-        r"([\da-z\.-]+)\.([a-z\.]{2,6})"
-        r"([\/\w \.-]*)*\/?$"
+    try:
+        parts = urlsplit(url)
+        if not parts.netloc:
+            # Scheme-less URLs such as "example.com:8080/path" are accepted as
+            # http; any userinfo the prefix exposes is rejected below
+            parts = urlsplit(f"http://{url}")
+        hostname = parts.hostname
+        parts.port  # raises ValueError for a malformed port
+    except ValueError:
+        return False
+    
+    if (
+        parts.scheme not in _URL_SCHEMES
+        or parts.username is not None
+        or parts.password is not None
+        or not hostname
+    ):
+        return False
+    
+    # Dotted ASCII host name with an alphabetic top-level domain
+    labels = hostname.replace("-", "").replace(".", "")
+    _, dot, tld = hostname.rpartition(".")
+    return (
+        bool(dot)
+        and hostname.isascii()
+        and labels.isalnum()
+        and len(tld) >= 2
+        and tld.isalpha()
     )
-    return bool(url_pattern.match(url))
 
 
 def validate_date_range(start_date: str, end_date: str) -> Tuple[bool, str]:
@@ -250,23 +389,48 @@ def validate_date_range(start_date: str, end_date: str) -> Tuple[bool, str]:
         return False, "Invalid date format"
 
 
+def _file_extension(filename: str) -> str:
+    """
+    Return the lower-cased extension of a file name.
+    
+    Same result as ``os.path.splitext(filename)[1].lower()``: dots in
+    directory names and leading dots (".bashrc") do not start an extension.
+    
+    Args:
+        filename: Name or path of the file
+        
+    Returns:
+        Extension including the dot, or an empty string
+    """
+    dot = filename.rfind(".")
+    start = filename.rfind("/") + 1
+    
+    if dot <= start:
+        return ""
+    
+    # Leading dots of the base name are part of the name, not an extension
+    if not filename[start:dot].strip("."):
+        return ""
+    
+    return filename[dot:].lower()
+
+
 def validate_file_extension(
     filename: str,
-    allowed_extensions: list
+    allowed_extensions: Collection[str]
 ) -> Tuple[bool, str]:
     """
     Validate file extension.
     
     Args:
         filename: Name of the file
-        allowed_extensions: List of allowed extensions (e.g., ['.pdf', '.docx'])
+        allowed_extensions: Allowed extensions (e.g., ['.pdf', '.docx']);
+            pass a frozenset built once for constant-time lookups
         
     Returns:
         Tuple of (is_valid, error_message)
     """
-    import os
-    
-    ext = os.path.splitext(filename)[1].lower()
+    ext = _file_extension(filename)
     
     if ext not in allowed_extensions:
         return False, f"File type {ext} not allowed. Allowed: {', '.join(allowed_extensions)}"